@@ -0,0 +1,155 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+
+class AudioCache:
+    """Content-addressed on-disk audio cache with an LRU size cap and a JSON index"""
+
+    def __init__(self, cache_dir: str, max_bytes: int = 100 * 1024 * 1024, name: str = "audio"):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.name = name
+        self.index_file = os.path.join(cache_dir, "index.json")
+        self._lock = threading.Lock()
+        self._last_index_save = 0.0
+        self._index_dirty = False
+        self.index = self._load_index()
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        """Build a cache key from everything that affects the audio content"""
+        payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[str, bytes]]:
+        """Return (path, audio bytes) for key and mark it recently used, or None"""
+        with self._lock:
+            entry = self.index.get(key)
+            if not entry:
+                return None
+            path = os.path.join(self.cache_dir, entry['file'])
+            # Read while holding the lock so a concurrent eviction can't delete the file under us
+            try:
+                with open(path, 'rb') as f:
+                    data = f.read()
+            except OSError:
+                del self.index[key]
+                self._index_dirty = True
+                return None
+            entry['last_access'] = time.time()
+            self._index_dirty = True
+            # Access times only matter for eviction order - don't rewrite the index on every hit
+            if time.time() - self._last_index_save > 30:
+                self._save_index()
+            return path, data
+
+    def put_bytes(self, key: str, data: bytes, suffix: str = '.mp3', meta: Optional[Dict] = None) -> Optional[str]:
+        """Store audio bytes under key and return the cached file path"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(suffix=suffix, dir=self.cache_dir)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            return self.put_file(key, temp_path, suffix, meta)
+        except Exception as e:
+            print(f"⚠️ Could not cache {self.name} audio: {e}")
+            return None
+
+    def put_file(self, key: str, src_path: str, suffix: str = '.mp3', meta: Optional[Dict] = None) -> Optional[str]:
+        """Move an existing audio file into the cache under key and return its new path (None if it didn't fit)"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            filename = f"{key}{suffix}"
+            path = os.path.join(self.cache_dir, filename)
+            with self._lock:
+                os.replace(src_path, path)
+                self.index[key] = {
+                    'file': filename,
+                    'size': os.path.getsize(path),
+                    'last_access': time.time(),
+                    'meta': meta or {}
+                }
+                self._evict()
+                self._save_index()
+                if key not in self.index:
+                    return None
+            return path
+        except Exception as e:
+            print(f"⚠️ Could not cache {self.name} audio: {e}")
+            if os.path.exists(src_path):
+                try:
+                    os.unlink(src_path)
+                except OSError:
+                    pass
+            return None
+
+    def get_meta(self, key: str) -> Dict:
+        """Return the metadata stored with key (empty if not cached)"""
+        with self._lock:
+            entry = self.index.get(key)
+            return dict(entry.get('meta', {})) if entry else {}
+
+    def update_meta(self, key: str, **changes):
+        """Merge changes into an existing entry's metadata"""
+        with self._lock:
+            entry = self.index.get(key)
+            if entry:
+                entry.setdefault('meta', {}).update(changes)
+                self._save_index()
+
+    def owns(self, path: Optional[str]) -> bool:
+        """Check whether a file lives inside this cache (and must not be deleted by callers)"""
+        if not path:
+            return False
+        cache_root = os.path.abspath(self.cache_dir)
+        return os.path.abspath(path).startswith(cache_root + os.sep)
+
+    def flush(self):
+        """Write pending index changes to disk"""
+        with self._lock:
+            if self._index_dirty:
+                self._save_index()
+
+    def _evict(self):
+        """Remove least recently used entries until the cache fits (lock must be held)"""
+        total = sum(entry.get('size', 0) for entry in self.index.values())
+        if total <= self.max_bytes:
+            return
+        for key in sorted(self.index, key=lambda k: self.index[k].get('last_access', 0)):
+            if total <= self.max_bytes:
+                break
+            entry = self.index.pop(key)
+            total -= entry.get('size', 0)
+            try:
+                os.unlink(os.path.join(self.cache_dir, entry['file']))
+            except OSError:
+                pass
+        print(f"🧹 Trimmed {self.name} cache to {total / (1024 * 1024):.1f} MB")
+
+    def _load_index(self) -> Dict:
+        """Load the cache index from disk"""
+        try:
+            if os.path.exists(self.index_file):
+                with open(self.index_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            print(f"⚠️ Error loading {self.name} cache index: {e}")
+        return {}
+
+    def _save_index(self):
+        """Save the cache index atomically (lock must be held)"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_file = f"{self.index_file}.tmp"
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(self.index, f)
+            os.replace(temp_file, self.index_file)
+            self._last_index_save = time.time()
+            self._index_dirty = False
+        except Exception as e:
+            print(f"⚠️ Error saving {self.name} cache index: {e}")
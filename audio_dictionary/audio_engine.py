@@ -0,0 +1,229 @@
+import io
+import queue
+import threading
+from collections import deque
+from typing import Callable, Iterable, Optional, Tuple
+
+import pygame
+
+# Posted by pygame.mixer.music whenever a track finishes (or is stopped)
+MUSIC_END_EVENT = pygame.USEREVENT + 1
+
+# A job source yields encoded audio segments as (bytes, format hint), checking the token between them
+AudioSource = Callable[["CancelToken"], Iterable[Tuple[Optional[bytes], str]]]
+
+
+class CancelToken:
+    """Cancellation flag for one audio job"""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+
+class AudioJob:
+    """One pronunciation or speech request and its playback progress"""
+
+    def __init__(self, kind: str, label: str, source: AudioSource):
+        self.kind = kind
+        self.label = label
+        self.source = source
+        self.token = CancelToken()
+        # loading -> playing <-> paused; engine thread only
+        self.state = "loading"
+        self.pending = deque()
+        self.track_active = False
+        self.source_done = False
+        self.segments_played = 0
+
+
+class AudioEngine:
+    """Single thread that owns pygame.mixer.music; the rest of the app sends it commands"""
+
+    def __init__(self, end_event: int = MUSIC_END_EVENT, on_state_change: Optional[Callable[[], None]] = None):
+        pygame.mixer.music.set_endevent(end_event)
+        # Called from the engine thread whenever what the UI shows (current job, its state) changes
+        self.on_state_change = on_state_change
+        self.commands = queue.Queue()
+        self._lock = threading.Lock()
+        self.current: Optional[AudioJob] = None
+        # Job whose track is loaded in the mixer and the buffer it streams from (engine thread only)
+        self.mixer_job: Optional[AudioJob] = None
+        self.buffer = None
+        self.thread = threading.Thread(target=self._run, name="audio-engine", daemon=True)
+        self.thread.start()
+
+    # --- Commands (safe to call from any thread, never block) ---
+
+    def play(self, label: str, source: AudioSource) -> AudioJob:
+        """Replace whatever is playing with a pronunciation job"""
+        return self._submit(AudioJob("pronunciation", label, source))
+
+    def speak(self, label: str, source: AudioSource) -> AudioJob:
+        """Replace whatever is playing with a multi-segment speech job"""
+        return self._submit(AudioJob("speech", label, source))
+
+    def pause(self):
+        self.commands.put(("pause",))
+
+    def resume(self):
+        self.commands.put(("resume",))
+
+    def stop(self, kind: Optional[str] = None):
+        """Cancel the current job (only if it is of `kind`, when given); takes effect immediately"""
+        with self._lock:
+            job = self.current
+            if job is None or (kind and job.kind != kind):
+                return
+            job.token.cancel()
+            self.current = None
+        self.commands.put(("halt", job))
+
+    def set_volume(self, volume: float):
+        self.commands.put(("volume", volume))
+
+    def notify_track_end(self):
+        """Forward the mixer's end event from the main loop"""
+        self.commands.put(("ended",))
+
+    def shutdown(self):
+        self.stop()
+        self.commands.put(("quit",))
+
+    # --- State views for the UI ---
+
+    def is_loading(self, kind: str) -> bool:
+        job = self.current
+        return job is not None and job.kind == kind and job.state == "loading"
+
+    def is_playing(self, kind: str) -> bool:
+        job = self.current
+        return job is not None and job.kind == kind and job.state == "playing"
+
+    def is_paused(self, kind: str) -> bool:
+        job = self.current
+        return job is not None and job.kind == kind and job.state == "paused"
+
+    def is_active(self, kind: str) -> bool:
+        job = self.current
+        return job is not None and job.kind == kind
+
+    # --- Engine thread ---
+
+    def _submit(self, job: AudioJob) -> AudioJob:
+        with self._lock:
+            previous = self.current
+            if previous is not None:
+                previous.token.cancel()
+            self.current = job
+        if previous is not None:
+            self.commands.put(("halt", previous))
+        threading.Thread(target=self._load, args=(job,), name=f"audio-{job.kind}", daemon=True).start()
+        return job
+
+    def _load(self, job: AudioJob):
+        """Run a job's source off the engine thread and hand segments over as they are ready"""
+        try:
+            for data, name_hint in job.source(job.token):
+                if job.token.cancelled:
+                    return
+                if data:
+                    self.commands.put(("segment", job, data, name_hint))
+        except Exception as e:
+            print(f"❌ Error loading audio for {job.label}: {e}")
+        finally:
+            self.commands.put(("source_done", job))
+
+    def _run(self):
+        while True:
+            command, *args = self.commands.get()
+            if command == "quit":
+                return
+            before = self._visible_state()
+            try:
+                getattr(self, f"_on_{command}")(*args)
+            except Exception as e:
+                print(f"❌ Audio engine error ({command}): {e}")
+            if self.on_state_change and self._visible_state() != before:
+                self.on_state_change()
+
+    def _visible_state(self) -> Tuple[Optional[AudioJob], Optional[str]]:
+        job = self.current
+        return job, job.state if job is not None else None
+
+    def _is_current(self, job: AudioJob) -> bool:
+        return job is self.current and not job.token.cancelled
+
+    def _on_segment(self, job: AudioJob, data: bytes, name_hint: str):
+        if not self._is_current(job):
+            return
+        job.pending.append((data, name_hint))
+        if not job.track_active and job.state != "paused":
+            self._play_next(job)
+
+    def _on_source_done(self, job: AudioJob):
+        job.source_done = True
+        if self._is_current(job) and not job.track_active and not job.pending:
+            self._finish(job)
+
+    def _on_ended(self):
+        job = self.mixer_job
+        # Stale events: stop()/load() of an older track, or a pause (which never ends a track)
+        if job is None or not job.track_active or job.state == "paused" or pygame.mixer.music.get_busy():
+            return
+        job.track_active = False
+        if not self._is_current(job):
+            return
+        if job.pending:
+            self._play_next(job)
+        elif job.source_done:
+            self._finish(job)
+
+    def _on_pause(self):
+        job = self.current
+        if job is not None and job.track_active and job.state == "playing":
+            pygame.mixer.music.pause()
+            job.state = "paused"
+            print(f"⏸️ Paused {job.label}")
+
+    def _on_resume(self):
+        job = self.current
+        if job is not None and job.state == "paused":
+            pygame.mixer.music.unpause()
+            job.state = "playing"
+            print(f"⏯️ Resumed {job.label}")
+
+    def _on_halt(self, job: AudioJob):
+        if self.mixer_job is job and job.track_active:
+            pygame.mixer.music.stop()
+            job.track_active = False
+            print(f"⏹️ Stopped {job.label}")
+
+    def _on_volume(self, volume: float):
+        pygame.mixer.music.set_volume(volume)
+
+    def _play_next(self, job: AudioJob):
+        data, name_hint = job.pending.popleft()
+        # The mixer streams from the buffer while playing, so keep it referenced
+        self.buffer = io.BytesIO(data)
+        pygame.mixer.music.load(self.buffer, name_hint)
+        pygame.mixer.music.play()
+        self.mixer_job = job
+        job.track_active = True
+        job.state = "playing"
+        job.segments_played += 1
+
+    def _finish(self, job: AudioJob):
+        if job.segments_played:
+            print(f"✅ Finished {job.label}")
+        else:
+            print(f"❌ No audio available for {job.label}")
+        with self._lock:
+            if self.current is job:
+                self.current = None
@@ -0,0 +1,109 @@
+import argparse
+import contextlib
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO
+
+from audio_dictionary.model import DictionaryModel
+
+
+def read_words(stream: TextIO) -> Iterator[str]:
+    """Yield words from a text stream, one per line, skipping blanks and # comments"""
+    for line in stream:
+        word = line.strip()
+        if word and not word.startswith('#'):
+            yield word
+
+
+def lookup_many(model: DictionaryModel, words: Iterable[str], max_workers: int = 8,
+                use_suggestions: bool = True) -> Iterator[Dict]:
+    """Look up many words concurrently, yielding results as they complete"""
+    max_pending = max(1, max_workers) * 2
+
+    def lookup(word):
+        try:
+            # Bulk lookups share the model's API rate limiter and wait for tokens instead of falling back
+            return model.lookup_word(word, use_suggestions=use_suggestions, rate_wait=math.inf)
+        except Exception as e:
+            return {"word": word, "success": False, "source": "error", "latency_ms": None,
+                    "audio_url": None, "data": None, "error": str(e)}
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        pending = set()
+        for word in words:
+            # Keep the queue bounded so huge word lists don't all get submitted up front
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+            pending.add(executor.submit(lookup, word))
+
+        for future in pending:
+            yield future.result()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Batch lookup CLI: read words, write JSON Lines results"""
+    parser = argparse.ArgumentParser(
+        prog="python -m audio_dictionary.batch",
+        description="Look up words in bulk and stream results as JSON Lines."
+    )
+    parser.add_argument("input", nargs="?", default="-", help="file with one word per line (default: stdin)")
+    parser.add_argument("-o", "--output", default="-", help="output JSONL file (default: stdout)")
+    parser.add_argument("-w", "--workers", type=int, default=8, help="concurrent lookups (default: 8)")
+    parser.add_argument("-r", "--rate", type=float, default=5.0, help="max online API requests per second, 0 = unlimited (default: 5)")
+    parser.add_argument("--offline", action="store_true", help="use the local dictionary only")
+    parser.add_argument("--no-suggestions", action="store_true", help="disable fuzzy suggestions for unknown words")
+    parser.add_argument("--no-data", action="store_true", help="omit definition data from the output")
+    parser.add_argument("-q", "--quiet", action="store_true", help="suppress progress logging")
+    args = parser.parse_args(argv)
+
+    input_stream = sys.stdin if args.input == "-" else open(args.input, 'r', encoding='utf-8')
+    output_stream = sys.stdout if args.output == "-" else open(args.output, 'w', encoding='utf-8')
+
+    # Model logging goes to stderr so stdout stays valid JSON Lines
+    log_stream = open(os.devnull, 'w') if args.quiet else sys.stderr
+
+    found = 0
+    total = 0
+    start_time = time.time()
+    try:
+        with contextlib.redirect_stdout(log_stream):
+            model = DictionaryModel()
+            model.set_offline_mode(args.offline)
+            model.set_api_rate_limit(args.rate)
+            # Words learned online are written to the local dictionary once, at the end
+            model.webster_autosave = False
+
+            try:
+                for result in lookup_many(model, read_words(input_stream), max_workers=args.workers,
+                                          use_suggestions=not args.no_suggestions):
+                    if args.no_data:
+                        result.pop("data", None)
+                    output_stream.write(json.dumps(result, ensure_ascii=False) + "\n")
+                    output_stream.flush()
+                    total += 1
+                    found += 1 if result.get("success") else 0
+            finally:
+                model.flush_webster_dictionary()
+                model.pronunciation_cache.flush()
+                model.tts_service.shutdown()
+    finally:
+        if input_stream is not sys.stdin:
+            input_stream.close()
+        if output_stream is not sys.stdout:
+            output_stream.close()
+        if log_stream is not sys.stderr:
+            log_stream.close()
+
+    elapsed = time.time() - start_time
+    print(f"✅ Looked up {total} words ({found} found) in {elapsed:.2f}s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Keep pygame's import banner out of the report
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import pygame
+
+from audio_dictionary.view import DictionaryView
+
+# Arguments draw_main_interface gets from the controller on a typical online frame
+FRAME_ARGS = (None, True, "online", 1200, "Webster's Dictionary", False, True)
+
+SAMPLE_DEFINITIONS = [
+    "The occurrence and development of events by chance in a happy or beneficial way.",
+    "An aptitude for making desirable discoveries by accident, often while looking for something else entirely.",
+    "A pleasant surprise or a fortunate discovery that arrives without being sought.",
+]
+
+
+def sample_word_data(word: str = "serendipity", meanings: int = 4) -> List[Dict]:
+    """A deterministic API-style result long enough to scroll"""
+    parts_of_speech = ["noun", "verb", "adjective", "adverb"]
+    return [{
+        "word": word,
+        "phonetic": "/ˌsɛɹ.ənˈdɪp.ɪ.ti/",
+        "audio_available": True,
+        "meanings": [{
+            "partOfSpeech": parts_of_speech[i % len(parts_of_speech)],
+            "definitions": [{
+                "definition": SAMPLE_DEFINITIONS[(i + j) % len(SAMPLE_DEFINITIONS)] * 2,
+                "example": f"It was pure {word} that we met again, example {j + 1}.",
+            } for j in range(3)],
+            "synonyms": ["chance", "fluke", "fortune", "luck", "providence"],
+            "antonyms": ["misfortune", "design"],
+        } for i in range(meanings)],
+    }]
+
+
+def sample_history(entries: int) -> List[Dict]:
+    return [{
+        "word": f"word{i:04d}",
+        "timestamp": f"2024-01-{1 + i % 28:02d}T12:{i % 60:02d}:00",
+        "source": "online" if i % 3 else "local",
+    } for i in range(entries)]
+
+
+# A scenario prepares the view once, then updates its state before every frame
+Step = Callable[[DictionaryView, int, int], None]
+Scenario = Tuple[Callable[[DictionaryView], None], Step]
+
+
+def _show_result(view: DictionaryView):
+    view.show_main_view()
+    view.set_word_data(sample_word_data(), "online")
+    view.scroll_offset = 0
+
+
+def _scroll(view: DictionaryView, frame: int, frames: int):
+    # Sweep from top to bottom and back so every part of the content is drawn
+    half = max(1, frames // 2)
+    position = frame % frames
+    fraction = position / half if position < half else (frames - position) / half
+    view.scroll_offset = int(fraction * max(0, view.content_height - view.content_rect.height))
+
+
+def _drag(view: DictionaryView, frame: int, frames: int):
+    # Like a scrollbar drag, which sets a fractional scroll_offset
+    half = max(1, frames // 2)
+    position = frame % frames
+    fraction = position / half if position < half else (frames - position) / half
+    max_scroll = max(0, view.content_height - view.content_rect.height)
+    view.scroll_offset = min(max_scroll, fraction * max_scroll + 0.5)
+
+
+def _static(view: DictionaryView, frame: int, frames: int):
+    pass
+
+
+def _show_history(view: DictionaryView, entries: int = 500):
+    view.set_history_data(sample_history(entries))
+
+
+def _show_settings(view: DictionaryView):
+    view.show_main_view()
+    view.show_settings()
+
+
+def _scroll_settings(view: DictionaryView, frame: int, frames: int):
+    view.scroll_offset = int(view.settings_max_scroll * (frame % frames) / max(1, frames - 1))
+
+
+def _type(view: DictionaryView, frame: int, frames: int):
+    text = "serendipitous discoveries"
+    view.active = True
+    view.input_text = text[:frame % (len(text) + 1)]
+    view.cursor_position = len(view.input_text)
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "result": (_show_result, _static),
+    "scroll": (_show_result, _scroll),
+    "typing": (_show_result, _type),
+    "history": (_show_history, _scroll),
+    "history-drag": (_show_history, _drag),
+    "settings": (_show_settings, _scroll_settings),
+}
+
+
+def run_scenario(view: DictionaryView, name: str, frames: int, dump_dir: Optional[str] = None,
+                 dump_every: int = 0) -> Dict:
+    """Draw `frames` frames of one scenario and return its frame-time statistics"""
+    setup, step = SCENARIOS[name]
+    # Each scenario starts from an empty search box, whatever ran before it
+    view.input_text = ""
+    view.cursor_position = 0
+    view.active = False
+    setup(view)
+    # Freeze time-dependent state so repeated runs draw identical frames
+    view.mouse_pos = (-1, -1)
+    view.cursor_visible = True
+    view.cursor_timer = float("inf")
+    view.force_redraw()
+    view.profiler.set_enabled(True)
+
+    frame_times = []
+    for frame in range(frames):
+        step(view, frame, frames)
+        view.profiler.begin_frame()
+        start = time.perf_counter()
+        view.update_animations()
+        view.draw_main_interface(*FRAME_ARGS)
+        frame_times.append((time.perf_counter() - start) * 1000)
+        view.profiler.end_frame()
+        if dump_dir and (frame == 0 or (dump_every and frame % dump_every == 0)):
+            pygame.image.save(view.screen, os.path.join(dump_dir, f"{name}_{frame:04d}.png"))
+
+    phases = view.profiler.phase_averages()
+    view.profiler.set_enabled(False)
+    frame_times.sort()
+    return {
+        "scenario": name,
+        "frames": frames,
+        "mean_ms": sum(frame_times) / len(frame_times),
+        "p50_ms": frame_times[len(frame_times) // 2],
+        "p95_ms": frame_times[min(len(frame_times) - 1, int(len(frame_times) * 0.95))],
+        "max_ms": frame_times[-1],
+        "phases_ms": phases,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Headless rendering benchmark CLI"""
+    parser = argparse.ArgumentParser(
+        prog="python -m audio_dictionary.benchmark",
+        description="Render scripted UI states off-screen and report frame times."
+    )
+    parser.add_argument("scenarios", nargs="*", metavar="SCENARIO",
+                        help=f"scenarios to run (default: all of {', '.join(SCENARIOS)})")
+    parser.add_argument("-n", "--frames", type=int, default=200, help="frames per scenario (default: 200)")
+    parser.add_argument("--size", default="1000x700", help="window size WIDTHxHEIGHT (default: 1000x700)")
+    parser.add_argument("--dump", metavar="DIR", help="save PNG snapshots of the first frame of each scenario to DIR")
+    parser.add_argument("--dump-every", type=int, default=0, metavar="N", help="with --dump, also save every Nth frame")
+    parser.add_argument("--json", metavar="FILE", help="also write the results as JSON to FILE")
+    args = parser.parse_args(argv)
+
+    try:
+        width, height = (int(value) for value in args.size.lower().split("x"))
+    except ValueError:
+        parser.error(f"invalid --size {args.size!r}, expected WIDTHxHEIGHT")
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+    scenarios = args.scenarios or list(SCENARIOS)
+    if args.frames < 1:
+        parser.error("--frames must be at least 1")
+    if args.dump:
+        os.makedirs(args.dump, exist_ok=True)
+
+    # View logging goes to stderr so the report stays readable
+    with contextlib.redirect_stdout(sys.stderr):
+        view = DictionaryView(headless=True, size=(width, height))
+        results = [run_scenario(view, name, args.frames, args.dump, args.dump_every) for name in scenarios]
+
+    print(f"{'scenario':<12} {'frames':>6} {'mean':>8} {'p50':>8} {'p95':>8} {'max':>8}  slowest phases")
+    for result in results:
+        slowest = sorted(result["phases_ms"].items(), key=lambda item: item[1], reverse=True)[:3]
+        phases = ", ".join(f"{phase} {ms:.2f}" for phase, ms in slowest)
+        print(f"{result['scenario']:<12} {result['frames']:>6} {result['mean_ms']:>7.2f}ms {result['p50_ms']:>6.2f}ms "
+              f"{result['p95_ms']:>6.2f}ms {result['max_ms']:>6.2f}ms  {phases}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({"size": [width, height], "results": results}, f, indent=2)
+    if args.dump:
+        print(f"🖼️ Snapshots saved to: {args.dump}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
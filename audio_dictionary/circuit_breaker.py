@@ -0,0 +1,131 @@
+import threading
+import time
+from collections import deque
+from typing import Callable, Optional
+
+
+class CircuitBreaker:
+    """Circuit breaker with an adaptive timeout for a flaky online backend"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str = "backend", failure_threshold: int = 3,
+                 slow_call_threshold: float = 2.5, recovery_timeout: float = 15.0,
+                 max_recovery_timeout: float = 120.0, min_timeout: float = 0.75,
+                 max_timeout: float = 5.0, latency_window: int = 50,
+                 probe: Optional[Callable[[float], bool]] = None):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.slow_call_threshold = slow_call_threshold
+        self.base_recovery_timeout = recovery_timeout
+        self.recovery_timeout = recovery_timeout
+        self.max_recovery_timeout = max_recovery_timeout
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.probe = probe
+
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.latencies = deque(maxlen=latency_window)
+
+        self._lock = threading.Lock()
+        self._probe_running = False
+
+    def allow_request(self) -> bool:
+        """Return True if the backend may be called right now (never blocks)"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+
+            # Open or half-open: requests skip the network, a background probe decides recovery
+            if (self.state == self.OPEN and
+                    time.time() - self.opened_at >= self.recovery_timeout and
+                    not self._probe_running):
+                self.state = self.HALF_OPEN
+                self._start_probe()
+            return False
+
+    def get_timeout(self) -> float:
+        """Timeout adapted to the observed p95 latency of recent calls, including slow and timed-out ones"""
+        with self._lock:
+            if len(self.latencies) < 5:
+                return self.max_timeout
+            ordered = sorted(self.latencies)
+            p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        # Leave headroom above p95 so normal jitter doesn't count as a failure
+        return max(self.min_timeout, min(self.max_timeout, p95 * 2 + 0.25))
+
+    def record_success(self, latency: float):
+        """Record a completed call; slow calls count towards tripping the breaker"""
+        if latency >= self.slow_call_threshold:
+            print(f"🐢 Slow {self.name} response ({latency:.2f}s)")
+            self.record_failure(latency)
+            return
+
+        with self._lock:
+            self.latencies.append(latency)
+            self.consecutive_failures = 0
+            if self.state != self.CLOSED:
+                print(f"✅ {self.name} circuit closed")
+            self.state = self.CLOSED
+            self.recovery_timeout = self.base_recovery_timeout
+
+    def record_failure(self, latency: Optional[float] = None):
+        """Record a failed call and open the circuit after too many in a row
+
+        Pass the elapsed time for slow or timed-out calls so the adaptive timeout can grow with the API.
+        """
+        with self._lock:
+            if latency is not None:
+                self.latencies.append(latency)
+            self.consecutive_failures += 1
+            if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                self._open()
+
+    def get_state(self) -> str:
+        """Get the current circuit state"""
+        with self._lock:
+            return self.state
+
+    def _open(self):
+        """Open the circuit (lock must be held)"""
+        if self.state == self.HALF_OPEN:
+            # Failed recovery: back off the next probe
+            self.recovery_timeout = min(self.recovery_timeout * 2, self.max_recovery_timeout)
+        if self.state != self.OPEN:
+            print(f"🔌 {self.name} circuit opened - skipping network for {self.recovery_timeout:.0f}s")
+        # Latency has changed under us: start over from the default timeout once the circuit recovers
+        self.latencies.clear()
+        self.state = self.OPEN
+        self.opened_at = time.time()
+
+    def _start_probe(self):
+        """Probe the backend in the background while half-open (lock must be held)"""
+        if not self.probe:
+            # Nothing to probe with - let the next real request through
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+            return
+
+        self._probe_running = True
+
+        def probe_thread():
+            start_time = time.time()
+            try:
+                healthy = self.probe(self.max_timeout)
+            except Exception as e:
+                print(f"⚠️ {self.name} probe failed: {e}")
+                healthy = False
+            try:
+                if healthy:
+                    self.record_success(time.time() - start_time)
+                else:
+                    self.record_failure()
+            finally:
+                with self._lock:
+                    self._probe_running = False
+
+        threading.Thread(target=probe_thread, daemon=True).start()
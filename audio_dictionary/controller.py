@@ -1,14 +1,17 @@
 import pygame
 import os
 from pygame.locals import *
-import requests
 import threading
 import time
-import tempfile
 import json
 from audio_dictionary.tts_service import TextToSpeechService
 from audio_dictionary.model import DictionaryModel
 from audio_dictionary.view import DictionaryView
+from audio_dictionary.audio_engine import AudioEngine, MUSIC_END_EVENT
+from audio_dictionary.prefetcher import AudioPrefetcher
+
+# Carries a call from a worker thread to the main loop (pygame.event.post is thread-safe)
+UI_CALL_EVENT = pygame.USEREVENT + 2
 
 class DictionaryController:
     def __init__(self):
@@ -17,6 +20,12 @@ class DictionaryController:
         
         # Initialize pygame mixer for audio with proper settings
         pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+        # One engine thread owns the mixer; playback completion arrives as MUSIC_END_EVENT, and
+        # state changes wake the main loop so the audio controls update without polling
+        self.audio_engine = AudioEngine(MUSIC_END_EVENT,
+                                        on_state_change=lambda: self.call_on_ui_thread(self._on_audio_state_changed))
+        # Fetches pronunciation and definition audio in the background as soon as a result is shown
+        self.prefetcher = AudioPrefetcher()
         
         # Load settings
         self.settings_file = "data/settings.json"
@@ -45,23 +54,16 @@ class DictionaryController:
         self.data_source = "online"
         self.show_wifi_alert = False
         self.current_word_data = None
+        # Incremented per search so late online upgrades for older searches are ignored
+        self.search_generation = 0
+        # The word as submitted, for history (the search box may have changed since)
+        self.searched_word = ""
         
-        # Enhanced audio states
-        self.audio_playing = False
-        self.audio_paused = False
-        self.audio_loading = False
+        # Enhanced audio states (playing/paused/loading are read from the audio engine)
         self.audio_downloaded = False
         self.audio_file_path = None
-        
-        # TTS states
-        self.tts_speaking = False
-        self.tts_loading = False
-        
-        # Audio cancellation flags and thread tracking
-        self.cancel_audio = False
-        self.cancel_tts = False
-        self.current_audio_thread = None
-        self.current_tts_thread = None
+        # Last downloaded pronunciation as (url, mp3 bytes)
+        self.pronunciation_audio = None
         
         # Store button rects for click detection
         self.search_rect = None
@@ -74,6 +76,8 @@ class DictionaryController:
         self.progress_value = 0
         self.progress_max = 100
         self.progress_message = ""
+        # When set, the spinner is hidden at this time (it shows 100% briefly once a search completes)
+        self.progress_done_at = None
         # Track internet connectivity state
         self.has_connection = True
         
@@ -101,7 +105,12 @@ class DictionaryController:
             'audio_volume': 80,
             'search_suggestions': True,
             'offline_mode': False,
-            'auto_complete': True
+            'auto_complete': True,
+            'hedged_lookup': True,
+            'api_requests_per_second': 5,
+            'tts_backend': 'auto',
+            'prefetch_audio': True,
+            'show_profiler': False
         }
     
     def _apply_all_settings(self):
@@ -117,10 +126,17 @@ class DictionaryController:
         self.play_sound_effects = self.settings.get('play_sound_effects', True)
         self.search_suggestions = self.settings.get('search_suggestions', True)
         self.offline_mode = self.settings.get('offline_mode', False)
+        self.hedged_lookup = self.settings.get('hedged_lookup', True)
+        self.prefetch_audio = self.settings.get('prefetch_audio', True)
+        self.profiler = self.view.profiler
+        self.profiler.set_enabled(self.settings.get('show_profiler', False))
         
         # Apply to model
         self.model.set_offline_mode(self.offline_mode)
         self.model.set_search_suggestions(self.search_suggestions)
+        self.model.set_hedged_lookup(self.hedged_lookup)
+        self.model.set_api_rate_limit(self.settings.get('api_requests_per_second', 5))
+        self.model.tts_service.set_backend(self.settings.get('tts_backend', 'auto'))
         
         print("All settings applied:")
         print(f"  Auto-play pronunciation: {self.auto_play_pronunciation}")
@@ -142,10 +158,30 @@ class DictionaryController:
         except Exception as e:
             print(f"Error saving settings: {e}")
     
+    @property
+    def audio_playing(self):
+        return self.audio_engine.is_playing("pronunciation")
+    
+    @property
+    def audio_paused(self):
+        return self.audio_engine.is_paused("pronunciation")
+    
+    @property
+    def audio_loading(self):
+        return self.audio_engine.is_loading("pronunciation")
+    
+    @property
+    def tts_loading(self):
+        return self.audio_engine.is_loading("speech")
+    
+    @property
+    def tts_speaking(self):
+        return self.audio_engine.is_active("speech") and not self.tts_loading
+    
     def _apply_volume_setting(self):
         """Apply audio volume setting"""
         volume = self.settings.get('audio_volume', 80) / 100.0
-        pygame.mixer.music.set_volume(volume)
+        self.audio_engine.set_volume(volume)
         print(f"Audio volume set to: {volume * 100}%")
     
     def _play_sound_effect(self, sound_type):
@@ -179,13 +215,17 @@ class DictionaryController:
         # Main game loop
         clock = pygame.time.Clock()
         last_connection_check = 0
+        connection_check_interval = 10
+        # Event that woke an idle wait, handled on the next pass
+        waited_event = None
         
         while self.running:
             current_time = time.time()
+            self.profiler.begin_frame()
             
             # Check internet connection every 10 seconds (unless in offline mode)
             # Check internet connection every 10 seconds
-            if current_time - last_connection_check > 10:
+            if current_time - last_connection_check > connection_check_interval:
                 has_connection = False
                 try:
                     has_connection = self.model.check_internet_connection()
@@ -200,10 +240,17 @@ class DictionaryController:
                     self.show_wifi_alert = not has_connection
                 # Save current connectivity state for view usage
                 self.has_connection = has_connection
+                # Auto TTS switches to the local engine while we're offline
+                self.model.tts_service.set_online(has_connection and not self.offline_mode)
+                self.profiler.lap("connectivity")
         
             
             # Handle events
-            for event in pygame.event.get():
+            events = pygame.event.get()
+            if waited_event is not None:
+                events.insert(0, waited_event)
+                waited_event = None
+            for event in events:
                 if event.type == QUIT:
                     self._handle_exit()
                     self.running = False
@@ -212,6 +259,10 @@ class DictionaryController:
                 elif event.type == VIDEORESIZE:
                     self.view.handle_resize(event)
                 
+                elif event.type in (VIDEOEXPOSE, WINDOWEXPOSED):
+                    # The window contents were lost (uncovered/restored) - repaint everything
+                    self.view.force_redraw()
+                
                 elif event.type == MOUSEBUTTONDOWN:
                     if self.view.showing_settings:
                         # Handle settings window clicks
@@ -236,6 +287,14 @@ class DictionaryController:
                 
                 elif event.type == KEYDOWN:
                     self.handle_keydown(event)
+                
+                elif event.type == MUSIC_END_EVENT:
+                    self.audio_engine.notify_track_end()
+                
+                elif event.type == UI_CALL_EVENT:
+                    self._run_ui_call(event)
+            
+            self.profiler.lap("events")
             
             # Update audio state in view
             self.view.set_audio_state(
@@ -247,6 +306,9 @@ class DictionaryController:
             
             # Update progress bar - USE SPINNER METHODS
             self.update_progress(self.progress_value, self.progress_max, self.progress_message)
+            if self.progress_done_at is not None and time.time() >= self.progress_done_at:
+                self.progress_done_at = None
+                self.view.stop_spinner()
             
             # Prepare offline/connection message to show (string or False)
             wifi_message = False
@@ -256,8 +318,7 @@ class DictionaryController:
                 else:
                     wifi_message = "⚠️ No internet connection — using local dictionary"
 
-            # Draw interface (pass wifi_message to allow custom alert text)
-            search_rect, history_rect, audio_rects, settings_close_rect = self.view.draw_main_interface(
+            frame_args = (
                 None,
                 self.audio_available,
                 self.data_source,
@@ -267,22 +328,68 @@ class DictionaryController:
                 self.has_connection
             )
             
-            # Store button rects for click detection
-            self.search_rect = search_rect
-            self.history_rect = history_rect
-            self.audio_rects = audio_rects
-            self.settings_rect = self.view.settings_rect  # Get from view
-            self.settings_close_rect = settings_close_rect
-            
-            # (Notification drawing is handled by the view via the `show_wifi_alert` / message passed above)
+            # Only repaint and present the regions whose visible state changed since the last frame
+            self.view.update_animations()
+            dirty_rects = self.view.get_dirty_rects(frame_args)
+            self.profiler.lap("update")
+            if dirty_rects:
+                # Each dirty region is repainted under its own clip, so two far-apart regions
+                # don't repaint everything between them; widgets outside the clip are skipped
+                search_rect, history_rect, audio_rects, settings_close_rect = self.view.draw_dirty(frame_args, dirty_rects)
+                
+                # Store button rects for click detection
+                self.search_rect = search_rect
+                self.history_rect = history_rect
+                self.audio_rects = audio_rects
+                self.settings_rect = self.view.settings_rect  # Get from view
+                self.settings_close_rect = settings_close_rect
+                
+                # (Notification drawing is handled by the view via the `show_wifi_alert` / message passed above)
+                
+                pygame.display.update(dirty_rects)
+                self.profiler.lap("present")
+            self.profiler.end_frame()
             
-            pygame.display.flip()
-            clock.tick(60)
+            if self.view.is_animating():
+                clock.tick(60)
+            else:
+                # Nothing animating: sleep until input arrives, the cursor is due to blink or connectivity is due a check
+                timeout_ms = int((last_connection_check + connection_check_interval - time.time()) * 1000) + 1
+                view_timeout_ms = self.view.idle_timeout_ms()
+                if view_timeout_ms is not None:
+                    timeout_ms = min(timeout_ms, view_timeout_ms)
+                event = pygame.event.wait(max(1, timeout_ms))
+                if event.type != NOEVENT:
+                    waited_event = event
+                clock.tick()
         
         # Clean up
         self.stop_all_audio()
+        self.audio_engine.shutdown()
+        # Save words learned online that are still waiting for the deferred write
+        self.model.flush_webster_dictionary()
+        # Keep cache hit times recorded since the last index save, so LRU order survives restarts
+        self.model.pronunciation_cache.flush()
+        self.model.tts_service.shutdown()
         pygame.quit()
     
+    def call_on_ui_thread(self, func, *args, **kwargs):
+        """Run func(*args, **kwargs) on the main loop; worker threads use this instead of touching the view"""
+        try:
+            pygame.event.post(pygame.event.Event(UI_CALL_EVENT, func=func, args=args, kwargs=kwargs))
+        except pygame.error as e:
+            # Queue full or pygame already shut down
+            print(f"⚠️ Dropped UI update {getattr(func, '__name__', func)}: {e}")
+    
+    def _on_audio_state_changed(self):
+        """Nothing to do here: being woken up makes the main loop redraw the audio controls"""
+    
+    def _run_ui_call(self, event):
+        try:
+            event.func(*event.args, **event.kwargs)
+        except Exception as e:
+            print(f"❌ Error in UI update {getattr(event.func, '__name__', event.func)}: {e}")
+    
     def _handle_exit(self):
         """Handle application exit"""
         if self.clear_history_on_exit:
@@ -323,7 +430,12 @@ class DictionaryController:
                 'audio_volume': 80,
                 'search_suggestions': True,
                 'offline_mode': False,
-                'auto_complete': True
+                'auto_complete': True,
+                'hedged_lookup': True,
+                'api_requests_per_second': 5,
+                'tts_backend': 'auto',
+                'prefetch_audio': True,
+                'show_profiler': False
             }
             self.view.set_settings(default_settings)
             print("Settings reset to defaults")     
@@ -433,6 +545,15 @@ class DictionaryController:
     
     def handle_keydown(self, event):
         """Handle keyboard events"""
+        # Profiler keys work on every screen: F3 toggles the overlay, F4 exports the recorded frames
+        if event.key == K_F3:
+            self.profiler.set_enabled(not self.profiler.enabled)
+            print(f"📊 Frame profiler {'enabled' if self.profiler.enabled else 'disabled'}")
+            return
+        if event.key == K_F4:
+            self.profiler.export()
+            return
+        
         if self.view.active:
             # First handle auto-suggestion navigation
             if self.view.handle_suggestion_navigation(event):
@@ -480,6 +601,7 @@ class DictionaryController:
             
             # CANCEL ALL PREVIOUS AUDIO OPERATIONS FIRST
             self.cancel_all_audio_operations()
+            self.prefetcher.cancel()
             
             # Reset progress and start new search
             self.start_progress("Searching...")
@@ -490,7 +612,6 @@ class DictionaryController:
             self.view.show_suggestions = False  # Hide suggestions during search
             
             # Reset audio states
-            self.audio_loading = False
             self.audio_downloaded = False
             self.audio_file_path = None
             self.current_audio_url = None
@@ -500,33 +621,26 @@ class DictionaryController:
             print(f"Searching with suggestions: {use_suggestions}")
             
             # Start the search
-            self.model.fetch_word_data(word, self.on_word_data_received, use_suggestions=use_suggestions)
+            self.search_generation += 1
+            generation = self.search_generation
+            self.searched_word = word
+            # Results arrive on the fetch thread; hand them to the main loop
+            self.model.fetch_word_data(
+                word,
+                lambda *result: self.call_on_ui_thread(self.on_word_data_received, *result, generation=generation),
+                use_suggestions=use_suggestions,
+                upgrade_callback=lambda data, audio_url, source: self.call_on_ui_thread(
+                    self.on_word_data_upgraded, generation, data, audio_url, source)
+            )
     
     def cancel_all_audio_operations(self):
-        """Cancel all ongoing audio operations and threads"""
+        """Cancel all ongoing audio operations"""
         print("🛑 Cancelling all audio operations...")
         
-        # Set cancellation flags
-        self.cancel_audio = True
-        self.cancel_tts = True
-        
-        # Stop any playing audio immediately
+        # The engine cancels the job's token and drops its state immediately -
+        # late results from its loader are ignored, so there is nothing to wait for
         self.stop_all_audio()
         
-        # Wait a brief moment for threads to respond to cancellation
-        time.sleep(0.1)
-        
-        # Reset cancellation flags
-        self.cancel_audio = False
-        self.cancel_tts = False
-        
-        # Reset audio states
-        self.audio_loading = False
-        self.tts_loading = False
-        self.audio_playing = False
-        self.tts_speaking = False
-        self.audio_paused = False
-        
         print("✅ Audio operations cancelled")
     
     def start_progress(self, message="Loading..."):
@@ -534,6 +648,7 @@ class DictionaryController:
         self.progress_value = 0
         self.progress_max = 100
         self.progress_message = message
+        self.progress_done_at = None
         self.view.start_spinner(message)
     
     def update_progress(self, value, max_value=100, message=None):
@@ -547,9 +662,8 @@ class DictionaryController:
     def stop_progress(self):
         """Stop progress bar animation"""
         self.progress_value = 100
-        # Small delay to show completion
-        time.sleep(0.2)
-        self.view.stop_spinner()
+        # Show completion briefly; the main loop hides the spinner when this passes
+        self.progress_done_at = time.time() + 0.2
     
     def show_history(self):
         """Show search history"""
@@ -557,8 +671,11 @@ class DictionaryController:
         self.view.set_history_data(history_data)
         self.view.scroll_offset = 0
     
-    def on_word_data_received(self, success, data, audio_url, source):
+    def on_word_data_received(self, success, data, audio_url, source, generation=None):
         """Callback when word data is received - MODIFIED FOR ONLINE-FIRST PRIORITY"""
+        if generation is not None and generation != self.search_generation:
+            print("⏭️ Ignoring result for an older search")
+            return
         self.stop_progress()
         self.data_source = source
         
@@ -567,18 +684,13 @@ class DictionaryController:
             self.current_audio_url = audio_url
             
             # Set audio available based on the data
-            if data and len(data) > 0:
-                has_audio = data[0].get('has_audio', False)
-                audio_available = data[0].get('audio_available', False)
-                self.audio_available = has_audio or audio_available or (audio_url is not None)
-            else:
-                self.audio_available = audio_url is not None
+            self.audio_available = self._has_audio(data, audio_url)
                 
             self.view.set_word_data(data, source)
             print(f"✅ Word data loaded successfully from {source}")
             
             # ADD WORD TO HISTORY WITH ACTUAL DATA
-            word = self.view.input_text.strip()
+            word = self.searched_word
             if word and data:
                 try:
                     self.model.add_to_history(word, source, data)
@@ -586,6 +698,9 @@ class DictionaryController:
                 except Exception as e:
                     print(f"⚠️ Error adding to history: {e}")
             
+            # Start warming the audio caches right away so the first play is instant
+            self.prefetch_word_audio(data, audio_url, source)
+            
             # AUTO-GENERATE AUDIO AFTER SUCCESSFUL SEARCH
             self.auto_generate_audio()
             
@@ -604,8 +719,8 @@ class DictionaryController:
                 else:
                     self.view.show_error(data)
             else:
-                # If no internet and offline search also failed
-                if self.data_source == "offline" and not self.model.check_internet_connection():
+                # If no internet and offline search also failed (last known connectivity - no network calls on the UI thread)
+                if self.data_source == "offline" and not self.has_connection:
                     error_msg = "No internet connection and word not found in local dictionary"
                     self.view.show_error(error_msg)
                 else:
@@ -617,340 +732,306 @@ class DictionaryController:
             # Play error sound effect
             self._play_sound_effect("error")
     
+    @staticmethod
+    def _has_audio(data, audio_url):
+        """Whether a result can be pronounced: API audio, or a word we can synthesize"""
+        if data:
+            return bool(data[0].get('has_audio') or data[0].get('audio_available') or audio_url is not None)
+        return audio_url is not None
+    
+    def on_word_data_upgraded(self, generation, data, audio_url, source):
+        """Callback when richer online data arrives for a word already shown from the local dictionary"""
+        if generation != self.search_generation or not self.current_word_data:
+            print("⏭️ Ignoring online upgrade for an older search")
+            return
+        
+        self.data_source = source
+        self.current_word_data = data
+        self.current_audio_url = audio_url
+        self.audio_available = self._has_audio(data, audio_url)
+        
+        # Keep the reader's scroll position across the swap
+        scroll_offset = self.view.scroll_offset
+        self.view.set_word_data(data, source)
+        self.view.scroll_offset = min(scroll_offset, self.view.max_scroll)
+        print(f"⬆️ Word data upgraded from {source}")
+        self.prefetch_word_audio(data, audio_url, source)
+        
+        word = self.searched_word
+        if word and data:
+            try:
+                self.model.add_to_history(word, source, data)
+            except Exception as e:
+                print(f"⚠️ Error updating history: {e}")
+    
     def auto_generate_audio(self):
         """Automatically generate audio when word is successfully searched"""
         if not self.current_word_data:
             return
             
         print("🎵 Auto-generating audio for searched word...")
+        # The timers below belong to this search; a newer search makes them no-ops
+        generation = self.search_generation
         
         # Auto-play pronunciation if available and enabled
         if self.auto_play_pronunciation and self.audio_available:
             print("🔊 Auto-playing pronunciation...")
             # Small delay to ensure UI is updated
-            threading.Timer(0.5, self.play_pronunciation).start()
+            threading.Timer(0.5, self.call_on_ui_thread,
+                            args=(self._auto_play_for_search, generation, self.play_pronunciation)).start()
         
         # Auto-speak definition if enabled
         if self.auto_speak_definition:
             delay = 3 if self.audio_available else 1
             print(f"🗣️ Auto-speaking definition in {delay} seconds...")
-            threading.Timer(delay, self.speak_definition).start()
+            threading.Timer(delay, self.call_on_ui_thread,
+                            args=(self._auto_play_for_search, generation, self.speak_definition)).start()
+
+    def _auto_play_for_search(self, generation, play):
+        """Run a delayed auto-play, unless another search has started since it was scheduled"""
+        if generation != self.search_generation:
+            print("⏭️ Skipping auto-play for an older search")
+            return
+        play()
 
     def play_pronunciation(self):
         """Play pronunciation audio for ANY word (online or local)"""
-        if self.current_word_data and not self.audio_loading:
-            try:
-                # Check if we have cached TTS audio (works for both online and local words)
-                audio_path = None
-                if self.current_word_data and len(self.current_word_data) > 0:
-                    audio_path = self.current_word_data[0].get('audio_path')
-                
-                # Check if audio is available (either from online API or TTS)
-                has_audio = self.current_word_data[0].get('has_audio', False) if self.current_word_data else False
-                audio_available = self.current_word_data[0].get('audio_available', False) if self.current_word_data else False
-                
-                if audio_path and os.path.exists(audio_path):
-                    # Play cached TTS audio (works for both online and local words)
-                    print(f"🔊 Playing cached TTS audio: {audio_path}")
-                    self.audio_loading = False
-                    self.audio_playing = True
-                    self.audio_paused = False
-                    
-                    pygame.mixer.music.load(audio_path)
-                    pygame.mixer.music.play()
-                    
-                    # Start playback monitoring in a separate thread
-                    self.current_audio_thread = threading.Thread(target=self._wait_for_playback, daemon=True)
-                    self.current_audio_thread.start()
-                    
-                elif (has_audio or audio_available) and self.data_source in ["webster", "webster_suggestion", "not_found"]:
-                    # For locally found words without cached audio, generate it on the fly
-                    print("🎵 Generating TTS audio for local word...")
-                    self.audio_loading = True
-                    self.audio_playing = False
-                    self.audio_paused = False
-                    
-                    # Generate audio in a separate thread
-                    self.current_audio_thread = threading.Thread(target=self._generate_and_play_audio, daemon=True)
-                    self.current_audio_thread.start()
-                    
-                elif self.current_audio_url and self.audio_available and self.data_source == "online":
-                    # Download and play from online API (original behavior)
-                    self.audio_loading = True
-                    self.audio_playing = False
-                    self.audio_paused = False
-                    print(f"📥 Downloading pronunciation from: {self.current_audio_url}")
-                    self.current_audio_thread = threading.Thread(target=self._download_and_play_pronunciation, daemon=True)
-                    self.current_audio_thread.start()
-                else:
-                    print("❌ No pronunciation audio available")
-                    
-            except Exception as e:
-                print(f"❌ Error playing pronunciation audio: {e}")
-                self.audio_loading = False
-        elif self.audio_paused:
-            pygame.mixer.music.unpause()
-            self.audio_playing = True
-            self.audio_paused = False
-            print("⏯️ Resumed pronunciation audio")
-
-    def _generate_and_play_audio(self):
-        """Generate TTS audio for local words and play it"""
+        if self.audio_paused:
+            self.audio_engine.resume()
+            return
+        if not self.current_word_data or self.audio_loading:
+            return
         try:
-            if not self.current_word_data or self.cancel_audio:
-                return
-                
             word = self.current_word_data[0].get('word', '')
-            print(f"🎵 Generating TTS audio for: {word}")
             
-            # Use the model's TTS service to generate audio
-            audio_path = self.model._generate_word_audio(word, self.current_word_data[0])
+            # Check if we have cached TTS audio (works for both online and local words)
+            audio_path = self.current_word_data[0].get('audio_path')
             
-            # Check if audio was cancelled
-            if self.cancel_audio:
-                print(f"🛑 Audio generation cancelled for: {word}")
-                if audio_path and os.path.exists(audio_path):
-                    try:
-                        os.unlink(audio_path)
-                    except:
-                        pass
-                return
+            # Check if audio is available (either from online API or TTS)
+            has_audio = self.current_word_data[0].get('has_audio', False)
+            audio_available = self.current_word_data[0].get('audio_available', False)
             
-            if audio_path and os.path.exists(audio_path):
-                # Update the current word data with the new audio path
-                for entry in self.current_word_data:
-                    entry['audio_path'] = audio_path
+            if self.model.tts_service.has_audio(audio_path):
+                # Play cached TTS audio (works for both online and local words)
+                print(f"🔊 Playing cached TTS audio: {audio_path}")
+                self.audio_engine.play(f"pronunciation of '{word}'", self._cached_audio_source(audio_path))
                 
-                print("✅ TTS audio generated, now playing...")
-                self.audio_file_path = audio_path
-                self.audio_downloaded = True
-                self.audio_loading = False
+            elif (has_audio or audio_available) and self.data_source in ["webster", "webster_suggestion", "not_found"]:
+                # For locally found words without cached audio, generate it on the fly
+                print("🎵 Generating TTS audio for local word...")
+                self.audio_engine.play(f"pronunciation of '{word}'", self._generated_audio_source(self.current_word_data))
                 
-                # Check again for cancellation before playing
-                if self.cancel_audio:
-                    print("🛑 Audio playback cancelled before starting")
-                    return
+            elif (self.pronunciation_audio and self.current_audio_url
+                  and self.pronunciation_audio[0] == self.current_audio_url):
+                # Replay the pronunciation we already downloaded
+                print("🔊 Replaying downloaded pronunciation from memory")
+                audio_url, audio_data = self.pronunciation_audio
+                self.audio_engine.play(f"pronunciation of '{word}'",
+                                       lambda token: [(audio_data, self._audio_name_hint(audio_url))])
                 
-                pygame.mixer.music.load(audio_path)
-                pygame.mixer.music.play()
-                self.audio_playing = True
-                
-                # Monitor playback with cancellation check
-                while (pygame.mixer.music.get_busy() and 
-                       self.audio_playing and 
-                       not self.cancel_audio):
-                    pygame.time.wait(100)
-                
-                if not self.cancel_audio:
-                    self.audio_playing = False
-                    self.audio_paused = False
-                    print("✅ TTS audio finished")
-                else:
-                    print("🛑 TTS audio playback cancelled")
+            elif self.current_audio_url and self.audio_available and self.data_source == "online":
+                # Download (or load from the pronunciation cache) and play
+                print(f"📥 Fetching pronunciation from: {self.current_audio_url}")
+                self.audio_engine.play(f"pronunciation of '{word}'", self._download_audio_source(self.current_audio_url))
             else:
-                print("❌ Failed to generate TTS audio")
-                self.audio_loading = False
+                print("❌ No pronunciation audio available")
                 
         except Exception as e:
-            print(f"❌ Error generating and playing TTS audio: {e}")
-            self.audio_playing = False
-            self.audio_paused = False
-            self.audio_loading = False
-    
+            print(f"❌ Error playing pronunciation audio: {e}")
+
+    def _cached_audio_source(self, audio_path):
+        """Audio source for a file already in the TTS cache"""
+        def source(token):
+            yield self.model.tts_service.read_audio(audio_path), self._audio_name_hint(audio_path)
+        return source
+
+    def _generated_audio_source(self, word_data):
+        """Audio source that generates TTS audio for a local word"""
+        def source(token):
+            word = word_data[0].get('word', '')
+            print(f"🎵 Generating TTS audio for: {word}")
+            
+            # Use the model's TTS service to generate audio
+            audio_path = self.model._generate_word_audio(word, word_data[0])
+            if not audio_path or token.cancelled:
+                return
+            
+            # Record the new audio path on the UI thread so replays skip generation
+            self.call_on_ui_thread(self._on_generated_audio_ready, word_data, audio_path)
+            print("✅ TTS audio generated, now playing...")
+            yield self.model.tts_service.read_audio(audio_path), self._audio_name_hint(audio_path)
+        return source
+
+    def _download_audio_source(self, audio_url):
+        """Audio source for an online pronunciation (served from the pronunciation cache when possible)"""
+        def source(token):
+            audio_data = self.model.get_pronunciation_audio(audio_url)
+            if not audio_data or token.cancelled:
+                return
+            # Keep the MP3 in memory so replays don't even touch the disk cache
+            self.call_on_ui_thread(self._on_pronunciation_downloaded, audio_url, audio_data)
+            print("✅ Pronunciation audio ready, now playing...")
+            yield audio_data, self._audio_name_hint(audio_url)
+        return source
+
+    def _on_generated_audio_ready(self, word_data, audio_path):
+        """Remember synthesized pronunciation audio (UI thread)"""
+        # A newer search has its own audio state
+        if word_data is not self.current_word_data:
+            return
+        for entry in word_data:
+            entry['audio_path'] = audio_path
+        self.audio_file_path = audio_path
+        self.audio_downloaded = True
+
+    def _on_pronunciation_downloaded(self, audio_url, audio_data):
+        """Keep downloaded pronunciation audio for replays (UI thread)"""
+        if audio_url != self.current_audio_url:
+            return
+        self.pronunciation_audio = (audio_url, audio_data)
+        self.audio_downloaded = True
+
     def pause_pronunciation(self):
         """Pause currently playing pronunciation audio"""
-        if self.audio_playing and not self.audio_paused:
-            pygame.mixer.music.pause()
-            self.audio_paused = True
-            self.audio_playing = False
-            print("⏸️ Pronunciation audio paused")
+        if self.audio_playing:
+            self.audio_engine.pause()
     
     def stop_pronunciation(self):
         """Stop currently playing pronunciation audio"""
-        if self.audio_playing or self.audio_paused or self.audio_loading:
-            pygame.mixer.music.stop()
-            self.audio_playing = False
-            self.audio_paused = False
-            self.audio_loading = False
-            print("⏹️ Pronunciation audio stopped")
+        self.audio_engine.stop("pronunciation")
     
     def speak_definition(self):
         """Speak ONLY what is displayed on the interface - no extra content"""
-        if self.current_word_data and not self.tts_speaking and not self.tts_loading:
+        if self.current_word_data and not self.audio_engine.is_active("speech"):
             try:
-                # Stop any ongoing pronunciation first
-                self.stop_pronunciation()
-                
                 word = self.current_word_data[0].get('word', '')
-                phonetic = self.current_word_data[0].get('phonetic', '')
-                
-                # Build speech text to match EXACTLY what's shown on screen
-                speech_parts = []
-                
-                # Add word and phonetic (exactly as displayed)
-                speech_parts.append(f"The word is {word}")
-                if phonetic:
-                    speech_parts.append(f"pronounced {phonetic}")
-                
-                # Add meanings and definitions (only what's displayed)
-                for i, meaning in enumerate(self.current_word_data[0].get('meanings', [])[:3]):  # Only first 3 meanings like display
-                    part_of_speech = meaning.get('partOfSpeech', '')
-                    
-                    if part_of_speech:
-                        speech_parts.append(f"As a {part_of_speech}")
-                    
-                    # Add definitions (only first 2 per meaning like display)
-                    for j, definition in enumerate(meaning.get('definitions', [])[:2]):
-                        def_text = definition.get('definition', '')
-                        if def_text:
-                            speech_parts.append(f"Definition {j+1}: {def_text}")
-                        
-                        # Add examples (only if displayed)
-                        example_text = definition.get('example', '')
-                        if example_text:
-                            speech_parts.append(f"Example: {example_text}")
-                    
-                    # Add synonyms (only if displayed and limited to 5 like display)
-                    synonyms = meaning.get('synonyms', [])
-                    if synonyms:
-                        syn_text = ", ".join(synonyms[:5])
-                        speech_parts.append(f"Synonyms: {syn_text}")
-                    
-                    # Add antonyms (only if displayed and limited to 5 like display)
-                    antonyms = meaning.get('antonyms', [])
-                    if antonyms:
-                        ant_text = ", ".join(antonyms[:5])
-                        speech_parts.append(f"Antonyms: {ant_text}")
-                
-                # Combine all parts
-                speech_text = ". ".join(speech_parts)
+                speech_text = self._build_speech_text(self.current_word_data)
                 
                 print(f"🗣️ Speaking EXACTLY what's displayed for: {word}")
                 print(f"📝 Speech text: {speech_text[:100]}...")  # Log first 100 chars
                 
-                self.tts_loading = True
-                self.tts_speaking = False
-                
-                # Start TTS in a separate thread
-                self.current_tts_thread = threading.Thread(target=self._speak_text_with_gtts, args=(speech_text,), daemon=True)
-                self.current_tts_thread.start()
+                # Replaces (and cancels) any pronunciation that is still playing
+                self.audio_engine.speak(f"definition of '{word}'", self._speech_source(speech_text))
                 
             except Exception as e:
                 print(f"❌ Error in text-to-speech: {e}")
-                self.tts_loading = False
     
-    def _speak_text_with_gtts(self, text):
-        """Speak text using Google TTS with multiple attempts"""
-        try:
-            # Check for cancellation before starting
-            if self.cancel_tts:
-                print("🛑 TTS generation cancelled before starting")
-                return
-                
-            # Use the model's TTS service for reliable generation
-            audio_path = self.model.tts_service.generate_definition_audio("definition", text)
+    def _build_speech_text(self, word_data):
+        """Build the definition speech text from exactly what is shown on screen"""
+        word = word_data[0].get('word', '')
+        phonetic = word_data[0].get('phonetic', '')
+        
+        # Build speech text to match EXACTLY what's shown on screen
+        speech_parts = []
+        
+        # Add word and phonetic (exactly as displayed)
+        speech_parts.append(f"The word is {word}")
+        if phonetic:
+            speech_parts.append(f"pronounced {phonetic}")
+        
+        # Add meanings and definitions (only what's displayed)
+        for i, meaning in enumerate(word_data[0].get('meanings', [])[:3]):  # Only first 3 meanings like display
+            part_of_speech = meaning.get('partOfSpeech', '')
             
-            # Check if TTS was cancelled
-            if self.cancel_tts:
-                print("🛑 TTS generation cancelled")
-                if audio_path and os.path.exists(audio_path):
-                    try:
-                        os.unlink(audio_path)
-                    except:
-                        pass
-                return
+            if part_of_speech:
+                speech_parts.append(f"As a {part_of_speech}")
             
-            if audio_path and os.path.exists(audio_path):
-                # Check again for cancellation before playing
-                if self.cancel_tts:
-                    print("🛑 TTS playback cancelled before starting")
-                    return
-                    
-                pygame.mixer.music.load(audio_path)
-                pygame.mixer.music.play()
-                self.tts_speaking = True
+            # Add definitions (only first 2 per meaning like display)
+            for j, definition in enumerate(meaning.get('definitions', [])[:2]):
+                def_text = definition.get('definition', '')
+                if def_text:
+                    speech_parts.append(f"Definition {j+1}: {def_text}")
                 
-                # Monitor playback with cancellation check
-                while (pygame.mixer.music.get_busy() and 
-                       self.tts_speaking and 
-                       not self.cancel_tts):
-                    pygame.time.wait(100)
-                    
-                if not self.cancel_tts:
-                    print("✅ TTS finished playing")
-                else:
-                    print("🛑 TTS playback cancelled")
-                    
-        except Exception as e:
-            print(f"❌ Google TTS error: {e}")
-        finally:
-            self.tts_speaking = False
-            self.tts_loading = False
-    
-    def _wait_for_playback(self):
-        """Wait for audio playback to finish with cancellation support"""
-        try:
-            while (pygame.mixer.music.get_busy() and 
-                   self.audio_playing and 
-                   not self.cancel_audio):
-                pygame.time.wait(100)
+                # Add examples (only if displayed)
+                example_text = definition.get('example', '')
+                if example_text:
+                    speech_parts.append(f"Example: {example_text}")
             
-            if not self.cancel_audio:
-                self.audio_playing = False
-                self.audio_paused = False
-                print("✅ Audio playback finished")
-            else:
-                print("🛑 Audio playback cancelled")
-        except Exception as e:
-            print(f"❌ Error waiting for playback: {e}")
-            self.audio_playing = False
-            self.audio_paused = False
+            # Add synonyms (only if displayed and limited to 5 like display)
+            synonyms = meaning.get('synonyms', [])
+            if synonyms:
+                syn_text = ", ".join(synonyms[:5])
+                speech_parts.append(f"Synonyms: {syn_text}")
+            
+            # Add antonyms (only if displayed and limited to 5 like display)
+            antonyms = meaning.get('antonyms', [])
+            if antonyms:
+                ant_text = ", ".join(antonyms[:5])
+                speech_parts.append(f"Antonyms: {ant_text}")
+        
+        # Combine all parts
+        return ". ".join(speech_parts)
+
+    def _speech_source(self, text):
+        """Audio source for spoken text - chunks are synthesized in parallel and yielded as soon as each is ready"""
+        def source(token):
+            chunks = self.model.tts_service.split_into_chunks(text)
+            print(f"🧩 Speaking definition in {len(chunks)} chunk(s)")
+            playlist = self.model.tts_service.synthesize_segments(chunks)
+            try:
+                for index, (chunk, audio_path) in enumerate(playlist):
+                    if token.cancelled:
+                        print("🛑 TTS playback cancelled")
+                        return
+                    audio_data = self.model.tts_service.read_audio(audio_path)
+                    if not audio_data:
+                        print(f"⚠️ Skipping chunk {index + 1} - no audio generated")
+                        continue
+                    yield audio_data, self._audio_name_hint(audio_path)
+            finally:
+                playlist.cancel()
+        return source
     
-    def _download_and_play_pronunciation(self):
-        """Download and play pronunciation audio file"""
-        try:
-            print(f"📥 Downloading audio from: {self.current_audio_url}")
-            response = requests.get(self.current_audio_url, timeout=30)
-            if response.status_code == 200:
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as temp_file:
-                    temp_file.write(response.content)
-                    temp_path = temp_file.name
-                
-                print("✅ Audio downloaded, now playing...")
-                self.audio_file_path = temp_path
-                self.audio_downloaded = True
-                self.audio_loading = False
-                
-                # Check for cancellation before playing
-                if self.cancel_audio:
-                    print("🛑 Audio playback cancelled before starting")
-                    return
-                
-                pygame.mixer.music.load(temp_path)
-                pygame.mixer.music.play()
-                self.audio_playing = True
-                
-                # Monitor playback with cancellation check
-                while (pygame.mixer.music.get_busy() and 
-                       self.audio_playing and 
-                       not self.cancel_audio):
-                    pygame.time.wait(100)
-                
-                if not self.cancel_audio:
-                    self.audio_playing = False
-                    self.audio_paused = False
-                    print("✅ Pronunciation audio finished")
-                else:
-                    print("🛑 Pronunciation audio cancelled")
-                    
-        except Exception as e:
-            print(f"❌ Audio playback error: {e}")
-            self.audio_playing = False
-            self.audio_paused = False
-            self.audio_loading = False
+    def prefetch_word_audio(self, data, audio_url, source):
+        """Queue low-priority background fetches of the pronunciation and definition speech"""
+        if not self.prefetch_audio or not data:
+            return
+        tasks = []
+        if audio_url and source == "online":
+            tasks.append(lambda token: self._prefetch_pronunciation(audio_url, token))
+        elif data[0].get('has_audio') or data[0].get('audio_available'):
+            tasks.append(lambda token: self._prefetch_generated_pronunciation(data, token))
+        speech_text = self._build_speech_text(data)
+        tasks.append(lambda token: self._prefetch_speech(speech_text, token))
+        self.prefetcher.prefetch(tasks)
+    
+    def _prefetch_pronunciation(self, audio_url, token):
+        """Download API pronunciation audio into the cache and keep it in memory"""
+        audio_data = self.model.get_pronunciation_audio(audio_url)
+        if audio_data and not token.cancelled:
+            self.call_on_ui_thread(self._on_pronunciation_downloaded, audio_url, audio_data)
+            print("🔮 Prefetched pronunciation audio")
+    
+    def _prefetch_generated_pronunciation(self, word_data, token):
+        """Synthesize TTS pronunciation for a local word ahead of the first play"""
+        word = word_data[0].get('word', '')
+        audio_path = self.model._generate_word_audio(word, word_data[0])
+        if audio_path and not token.cancelled:
+            self.call_on_ui_thread(self._on_generated_audio_ready, word_data, audio_path)
+            print(f"🔮 Prefetched TTS pronunciation for '{word}'")
+    
+    def _prefetch_speech(self, speech_text, token):
+        """Synthesize definition speech chunks one at a time so user-initiated synthesis keeps priority"""
+        chunks = self.model.tts_service.split_into_chunks(speech_text)
+        for chunk in chunks:
+            if token.cancelled:
+                return
+            self.model.tts_service.generate_chunk_audio(chunk)
+        print(f"🔮 Prefetched definition speech ({len(chunks)} chunk(s))")
+    
+    @staticmethod
+    def _audio_name_hint(path):
+        """Format hint for the mixer, taken from a file path or URL extension"""
+        extension = os.path.splitext((path or "").split('?')[0])[1].lstrip('.').lower()
+        return extension if extension in ('mp3', 'wav', 'ogg') else "mp3"
     
     def _cleanup_audio_file(self):
         """Clean up downloaded audio file"""
+        if self.model.tts_service.is_cached_file(self.audio_file_path):
+            # Cached TTS audio is kept for replays - just drop our reference
+            self.audio_file_path = None
+            self.audio_downloaded = False
+            return
         if self.audio_file_path and os.path.exists(self.audio_file_path):
             try:
                 os.unlink(self.audio_file_path)
@@ -962,31 +1043,11 @@ class DictionaryController:
     
     def cancel_all_audio(self):
         """Cancel all ongoing audio operations"""
-        print("🛑 Cancelling all audio operations...")
-        
-        # Set cancellation flags
-        self.cancel_audio = True
-        self.cancel_tts = True
-        
-        # Stop any playing audio
-        self.stop_all_audio()
-        
-        # Reset cancellation flags after a short delay
-        def reset_cancel_flags():
-            time.sleep(0.2)  # Small delay to ensure cancellation is processed
-            self.cancel_audio = False
-            self.cancel_tts = False
-            print("✅ Audio cancellation flags reset")
-        
-        threading.Thread(target=reset_cancel_flags, daemon=True).start()
+        self.cancel_all_audio_operations()
     
     def stop_all_audio(self):
         """Stop all audio playback"""
-        self.stop_pronunciation()
-        if self.tts_speaking or self.tts_loading:
-            pygame.mixer.music.stop()
-            self.tts_speaking = False
-            self.tts_loading = False
+        self.audio_engine.stop()
         self._cleanup_audio_file()
 
     def clear_search_history(self):
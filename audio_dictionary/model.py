@@ -5,7 +5,12 @@ import threading
 import datetime
 from typing import Dict, Optional, List, Any, Callable
 import time
+from collections import OrderedDict
 from audio_dictionary.tts_service import TextToSpeechService
+from audio_dictionary.audio_cache import AudioCache
+from audio_dictionary.circuit_breaker import CircuitBreaker
+from audio_dictionary.single_flight import SingleFlight
+from audio_dictionary.rate_limiter import TokenBucket, backoff_delay, parse_retry_after
 
 class DictionaryModel:
     def __init__(self):
@@ -15,6 +20,13 @@ class DictionaryModel:
         self.webster_file = "data/websters_english_dictionary.json"
         self.history_file = "data/search_history.json"
         self.webster_dictionary = self._load_webster_dictionary()
+        self._webster_save_lock = threading.Lock()
+        # Words learned online are saved in batches: mark dirty, flush once after a short delay
+        self._webster_dirty = False
+        self._webster_save_timer = None
+        self.webster_save_delay = 5.0
+        self.webster_autosave = True
+        self._history_lock = threading.Lock()
         self.search_history = self._load_search_history()
         
         # Initialize enhanced TTS service
@@ -23,14 +35,39 @@ class DictionaryModel:
         # Settings
         self.offline_mode = False
         self.search_suggestions = True
+        self.hedged_lookup = True
         
-        # Cache for faster searches
-        self.search_cache = {}
+        # Cache for faster searches, oldest entry first (batch workers share it, hence the lock)
+        self.search_cache = OrderedDict()
         self.cache_size = 100
+        self._search_cache_lock = threading.Lock()
         
         # Performance tracking
         self.last_search_time = 0
         
+        # Circuit breaker around the online API so outages fall back to local instantly
+        self.api_breaker = CircuitBreaker("dictionaryapi.dev", probe=self._probe_online_api)
+        
+        # Concurrent lookups of the same word share one online request
+        self.lookup_flight = SingleFlight("online lookup")
+        
+        # Shared rate limit for the online API (None = wait as long as needed for a token)
+        self.api_limiter = TokenBucket(rate=5.0)
+        self.api_rate_wait = 2.0
+        self.api_max_retries = 2
+        
+        # Connectivity probes are cached briefly so each lookup doesn't make an extra request
+        self.connection_check_ttl = 10.0
+        self._connection_state = None
+        self._connection_checked_at = 0.0
+        self._connection_lock = threading.Lock()
+        
+        # Downloaded pronunciation audio, cached by URL and revalidated with ETag/Last-Modified
+        self.pronunciation_cache = AudioCache("data/audio_cache/pronunciations", max_bytes=50 * 1024 * 1024,
+                                              name="pronunciation")
+        self.pronunciation_max_age = 7 * 24 * 3600
+        self.pronunciation_flight = SingleFlight("pronunciation download")
+        
     def _load_webster_dictionary(self) -> Dict:
         """Load Webster's English Dictionary JSON file - OPTIMIZED"""
         try:
@@ -64,9 +101,14 @@ class DictionaryModel:
     def _save_search_history(self):
         """Save search history to JSON file"""
         try:
-            os.makedirs(os.path.dirname(self.history_file), exist_ok=True)
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(self.search_history, f, indent=2, ensure_ascii=False)
+            # Write a snapshot to a temp file and swap it in, so a crash never leaves a truncated history
+            with self._history_lock:
+                os.makedirs(os.path.dirname(self.history_file), exist_ok=True)
+                snapshot = list(self.search_history)
+                temp_file = f"{self.history_file}.tmp"
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    json.dump(snapshot, f, indent=2, ensure_ascii=False)
+                os.replace(temp_file, self.history_file)
         except Exception as e:
             print(f"Error saving search history: {e}")
 
@@ -79,14 +121,13 @@ class DictionaryModel:
             "data": data
         }
         
-        # Remove existing entry for the same word to avoid duplicates
-        self.search_history = [entry for entry in self.search_history if entry["word"].lower() != word.lower()]
-        
-        # Add new entry at the beginning
-        self.search_history.insert(0, history_entry)
-        
-        # Keep only last 50 entries
-        self.search_history = self.search_history[:50]
+        with self._history_lock:
+            # Remove existing entry for the same word to avoid duplicates
+            history = [entry for entry in self.search_history if entry["word"].lower() != word.lower()]
+            
+            # Add new entry at the beginning and keep only the last 50 entries
+            history.insert(0, history_entry)
+            self.search_history = history[:50]
         
         # Save to file
         self._save_search_history()
@@ -113,49 +154,122 @@ class DictionaryModel:
             print(f"Error generating word audio: {e}")
             return None
     
-    def fetch_word_data(self, word: str, callback: Callable, use_suggestions: bool = True) -> None:
-        """Fetch word definition - ALWAYS TRY ONLINE FIRST, THEN OFFLINE"""
+    def fetch_word_data(self, word: str, callback: Callable, use_suggestions: bool = True,
+                        upgrade_callback: Optional[Callable] = None) -> None:
+        """Fetch word definition - ALWAYS TRY ONLINE FIRST, THEN OFFLINE (hedged: local first, online upgrade later)"""
         def fetch_thread():
-            start_time = time.time()
-            word_lower = word.lower().strip()
-            print(f"🔍 Searching for: '{word_lower}'")
-            
-            # Check cache first (FASTEST)
-            cache_key = f"{word_lower}_{use_suggestions}"
-            if cache_key in self.search_cache:
-                cached_data = self.search_cache[cache_key]
-                print(f"✅ Found in cache: '{word_lower}'")
-                callback(True, cached_data['data'], cached_data['audio_url'], cached_data['source'])
-                return
-            
-            # STEP 1: ALWAYS TRY ONLINE FIRST (unless offline mode is explicitly enabled)
-            if not self.offline_mode:
-                print("🌐 Attempting online search first...")
-                self._try_online_then_local(word_lower, callback, use_suggestions, start_time)
-            else:
-                # Offline mode explicitly enabled - use local only
-                print("📴 Offline mode enabled - using local dictionary only")
-                self._fetch_from_local_dict_fast(word_lower, callback, use_suggestions, start_time)
+            self._resolve_word(word, callback, use_suggestions, upgrade_callback)
         
         threading.Thread(target=fetch_thread, daemon=True).start()
 
-    def _try_online_then_local(self, word: str, callback: Callable, use_suggestions: bool, start_time: float):
+    def lookup_word(self, word: str, use_suggestions: bool = True, rate_wait: Optional[float] = None) -> Dict:
+        """Look up a word synchronously with the same online -> local -> fuzzy logic (no UI needed)"""
+        start_time = time.time()
+        results = []
+        self._resolve_word(word, lambda *args: results.append(args), use_suggestions, None, rate_wait)
+        success, data, audio_url, source = results[0] if results else (False, "No result", None, "error")
+        
+        return {
+            "word": word,
+            "success": success,
+            "source": source,
+            "latency_ms": round((time.time() - start_time) * 1000, 1),
+            "audio_url": audio_url,
+            "data": data if success else None,
+            "error": None if success else data
+        }
+
+    def _resolve_word(self, word: str, callback: Callable, use_suggestions: bool,
+                      upgrade_callback: Optional[Callable], rate_wait: Optional[float] = None):
+        """Resolve a word through cache, online and local sources, reporting via callback"""
+        start_time = time.time()
+        word_lower = word.lower().strip()
+        print(f"🔍 Searching for: '{word_lower}'")
+        
+        # Check cache first (FASTEST)
+        cache_key = f"{word_lower}_{use_suggestions}"
+        with self._search_cache_lock:
+            cached_data = self.search_cache.get(cache_key)
+        if cached_data:
+            print(f"✅ Found in cache: '{word_lower}'")
+            callback(True, cached_data['data'], cached_data['audio_url'], cached_data['source'])
+            return
+        
+        # STEP 1: ALWAYS TRY ONLINE FIRST (unless offline mode is explicitly enabled)
+        if not self.offline_mode:
+            if self.hedged_lookup and upgrade_callback:
+                self._hedged_online_and_local(word_lower, callback, upgrade_callback, use_suggestions, start_time)
+            else:
+                print("🌐 Attempting online search first...")
+                self._try_online_then_local(word_lower, callback, use_suggestions, start_time, rate_wait)
+        else:
+            # Offline mode explicitly enabled - use local only
+            print("📴 Offline mode enabled - using local dictionary only")
+            self._fetch_from_local_dict_fast(word_lower, callback, use_suggestions, start_time)
+
+    def _hedged_online_and_local(self, word: str, callback: Callable, upgrade_callback: Callable,
+                                 use_suggestions: bool, start_time: float):
+        """Return the local entry immediately, then upgrade it with online data when it arrives"""
+        local_data = self._get_webster_word_data_enhanced(word)
+        if not local_data:
+            # Nothing to show early - behave like a normal online-first search
+            self._try_online_then_local(word, callback, use_suggestions, start_time)
+            return
+        
+        print(f"⚡ Local hit for '{word}' in {time.time() - start_time:.3f}s - fetching online upgrade")
+        callback(True, local_data, None, "webster")
+        
+        online_result = self._fetch_online(word, use_suggestions, start_time)
+        if online_result:
+            converted_data, audio_url = online_result
+            print(f"⬆️ Upgrading '{word}' with online data")
+            upgrade_callback(converted_data, audio_url, "online")
+        else:
+            # Online failed - remember the local answer instead
+            self._cache_result(word, use_suggestions, local_data, None, "webster")
+
+    def _try_online_then_local(self, word: str, callback: Callable, use_suggestions: bool, start_time: float,
+                               rate_wait: Optional[float] = None):
         """Try online first, then fall back to local if online fails"""
-        # First check if we have internet connection
+        online_result = self._fetch_online(word, use_suggestions, start_time, rate_wait)
+        if online_result:
+            converted_data, audio_url = online_result
+            callback(True, converted_data, audio_url, "online")
+            return
+        
+        # If we reach here, online search failed - try local
+        print(f"🔄 Online search failed, trying local dictionary for '{word}'")
+        self._fetch_from_local_dict_fast(word, callback, use_suggestions, start_time)
+    
+    def _fetch_online(self, word: str, use_suggestions: bool, start_time: float,
+                      rate_wait: Optional[float] = None) -> Optional[tuple]:
+        """Fetch and cache a word from the online API, returning (data, audio_url) or None"""
+        # Callers only share a request made with the same rate limiter wait, so an interactive lookup
+        # never inherits a batch caller's unbounded wait (or the other way round)
+        if rate_wait is None:
+            rate_wait = self.api_rate_wait
+        key = ("online", word.lower().strip(), rate_wait)
+        return self.lookup_flight.do(key, lambda: self._fetch_online_uncoalesced(word, use_suggestions, start_time,
+                                                                                 rate_wait))
+    
+    def _fetch_online_uncoalesced(self, word: str, use_suggestions: bool, start_time: float,
+                                  rate_wait: Optional[float] = None) -> Optional[tuple]:
+        """Do the actual online request for _fetch_online"""
+        # Skip the network entirely while the API circuit is open
+        if not self.api_breaker.allow_request():
+            print(f"🔌 Online API circuit {self.api_breaker.get_state()} - using local dictionary")
+            return None
+        
+        # First check if we have internet connection (cached, API outages are left to the breaker)
         if not self.check_internet_connection():
             print("🌐 No internet connection, switching to offline mode")
-            # If no internet, go straight to local dictionary
-            self._fetch_from_local_dict_fast(word, callback, use_suggestions, start_time)
-            return
+            return None
+        
+        response = self._request_online(word, rate_wait)
+        if response is None:
+            return None
         
-        # Try online search with timeout
         try:
-            api_url = f"https://api.dictionaryapi.dev/api/v2/entries/en/{word}"
-            print(f"🌐 Online search: {api_url}")
-            
-            # Use timeout for online request
-            response = requests.get(api_url, timeout=5)  # 5 second timeout
-            
             if response.status_code == 200:
                 data = response.json()
                 print(f"✅ Online success for '{word}'")
@@ -172,21 +286,84 @@ class DictionaryModel:
                     
                     # Cache the result
                     self._cache_result(word, use_suggestions, converted_data, audio_url, "online")
-                    callback(True, converted_data, audio_url, "online")
-                    return
+                    return converted_data, audio_url
             else:
                 print(f"❌ Online API returned status {response.status_code} for '{word}'")
-                
-        except requests.exceptions.Timeout:
-            print(f"⏰ Online timeout for '{word}' - switching to offline")
-        except requests.exceptions.ConnectionError:
-            print(f"🔌 Connection error for '{word}' - switching to offline")
         except Exception as e:
             print(f"❌ Online error for '{word}': {e}")
         
-        # If we reach here, online search failed - try local
-        print(f"🔄 Online search failed, trying local dictionary for '{word}'")
-        self._fetch_from_local_dict_fast(word, callback, use_suggestions, start_time)
+        return None
+    
+    def _request_online(self, word: str, rate_wait: Optional[float] = None) -> Optional[requests.Response]:
+        """GET the API entry for a word with rate limiting, Retry-After and jittered backoff"""
+        api_url = self.api_url.format(word=word)
+        # Callers may override how long to wait for a rate limiter token (math.inf: as long as it takes)
+        if rate_wait is None:
+            rate_wait = self.api_rate_wait
+        # Retries are one logical request: the breaker hears about a failure once, when we give up
+        failed = False
+        
+        for attempt in range(self.api_max_retries + 1):
+            if attempt > 0 and not self.api_breaker.allow_request():
+                if failed:
+                    self.api_breaker.record_failure()
+                return None
+            
+            # Wait for a rate limiter token (bounded, so interactive searches fall back quickly)
+            if not self.api_limiter.acquire(timeout=rate_wait):
+                print(f"🚦 Rate limit reached - skipping online lookup for '{word}'")
+                return None
+            
+            # Try online search with a timeout adapted to recent API latency
+            request_start = time.time()
+            try:
+                timeout = self.api_breaker.get_timeout()
+                print(f"🌐 Online search: {api_url} (timeout {timeout:.2f}s)")
+                response = requests.get(api_url, timeout=timeout)
+                self._note_connection(True)
+            except requests.exceptions.Timeout:
+                # Don't retry timeouts - the elapsed time feeds the breaker's adaptive timeout instead
+                self.api_breaker.record_failure(time.time() - request_start)
+                print(f"⏰ Online timeout for '{word}' - switching to offline")
+                return None
+            except requests.exceptions.ConnectionError:
+                failed = True
+                print(f"🔌 Connection error for '{word}' (attempt {attempt + 1})")
+                if attempt < self.api_max_retries:
+                    time.sleep(backoff_delay(attempt))
+                continue
+            except Exception as e:
+                print(f"❌ Online error for '{word}': {e}")
+                return None
+            
+            if response.status_code == 429:
+                # Throttled: the API is healthy, we are just too fast
+                failed = False
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                self.api_limiter.on_throttled(retry_after if retry_after is not None else backoff_delay(attempt))
+                print(f"🚦 API returned 429 for '{word}' (attempt {attempt + 1})")
+                continue
+            
+            if response.status_code >= 500:
+                failed = True
+                print(f"❌ Online API returned status {response.status_code} for '{word}' (attempt {attempt + 1})")
+                if attempt < self.api_max_retries:
+                    time.sleep(backoff_delay(attempt))
+                continue
+            
+            # Any other answer means the API itself is healthy
+            self.api_breaker.record_success(time.time() - request_start)
+            self.api_limiter.on_success()
+            return response
+        
+        if failed:
+            self.api_breaker.record_failure()
+        return None
+    
+    def _probe_online_api(self, timeout: float) -> bool:
+        """Background health probe used by the API circuit breaker"""
+        response = requests.get(self.api_url.format(word="hello"), timeout=timeout)
+        return response.status_code < 500
     
     def _fetch_from_local_dict_fast(self, word: str, callback: Callable, use_suggestions: bool, start_time: float):
         """Fast local-only search"""
@@ -417,8 +594,8 @@ class DictionaryModel:
             word_lower = word.lower()
             suggestions = []
             
-            # Simple and fast matching
-            for dict_word in self.webster_dictionary.keys():
+            # Simple and fast matching over a snapshot - other lookups may be adding online words
+            for dict_word in list(self.webster_dictionary):
                 if (word_lower in dict_word or 
                     dict_word in word_lower or 
                     self._simple_similarity(word_lower, dict_word) > 0.7):
@@ -435,10 +612,8 @@ class DictionaryModel:
                     total_time = time.time() - start_time
                     print(f"💡 Using suggestion: '{suggested_word}' for '{word}' in {total_time:.2f}s")
                     
-                    # Cache the result
+                    # Cache the result (history is recorded by the caller - batch lookups must not touch it)
                     self._cache_result(word, True, exact_data, None, "webster_suggestion")
-                    # Add to history with original word but suggested data
-                    self.add_to_history(word, exact_data, "webster_suggestion")
                     callback(True, exact_data, None, "webster_suggestion")
                 else:
                     callback(False, f"Word not found. Did you mean: {', '.join(suggestions[:3])}?", None, "suggestions")
@@ -484,20 +659,19 @@ class DictionaryModel:
         """Cache search results for faster future searches"""
         cache_key = f"{word.lower()}_{use_suggestions}"
         
-        # Add to cache
-        self.search_cache[cache_key] = {
-            'data': data,
-            'audio_url': audio_url,
-            'source': source,
-            'timestamp': time.time()
-        }
-        
-        # Limit cache size
-        if len(self.search_cache) > self.cache_size:
-            # Remove oldest entry
-            oldest_key = min(self.search_cache.keys(), 
-                           key=lambda k: self.search_cache[k]['timestamp'])
-            del self.search_cache[oldest_key]
+        with self._search_cache_lock:
+            # Add to cache (a refreshed entry counts as the newest)
+            self.search_cache[cache_key] = {
+                'data': data,
+                'audio_url': audio_url,
+                'source': source,
+                'timestamp': time.time()
+            }
+            self.search_cache.move_to_end(cache_key)
+            
+            # Limit cache size by removing the oldest entries
+            while len(self.search_cache) > self.cache_size:
+                self.search_cache.popitem(last=False)
     
     def _save_online_word_to_local(self, word: str, word_data: List[Dict]):
         """Save online word data to Webster's local dictionary"""
@@ -512,11 +686,9 @@ class DictionaryModel:
             webster_format_data = self._convert_to_webster_format(word_data[0] if word_data else {})
             
             if webster_format_data:
-                # Add to Webster's dictionary
+                # Add to Webster's dictionary; the file is rewritten later in one deferred save
                 self.webster_dictionary[word_lower] = webster_format_data
-                
-                # Save the updated dictionary to file (in background)
-                threading.Thread(target=self._save_webster_dictionary, daemon=True).start()
+                self._schedule_webster_save()
                 
                 print(f"💾 Saved '{word}' to local dictionary")
                 
@@ -562,18 +734,43 @@ class DictionaryModel:
             print(f"Error converting to Webster's format: {e}")
             return None
 
+    def _schedule_webster_save(self):
+        """Mark the dictionary dirty and start one delayed save unless one is already pending"""
+        with self._webster_save_lock:
+            self._webster_dirty = True
+            if not self.webster_autosave or self._webster_save_timer is not None:
+                return
+            self._webster_save_timer = threading.Timer(self.webster_save_delay, self.flush_webster_dictionary)
+            self._webster_save_timer.daemon = True
+            self._webster_save_timer.start()
+
+    def flush_webster_dictionary(self):
+        """Write the dictionary to disk if words were added since the last save"""
+        with self._webster_save_lock:
+            self._webster_save_timer = None
+            if not self._webster_dirty:
+                return
+            self._webster_dirty = False
+        self._save_webster_dictionary()
+
     def _save_webster_dictionary(self):
         """Save Webster's dictionary to file"""
         try:
-            os.makedirs(os.path.dirname(self.webster_file), exist_ok=True)
-            with open(self.webster_file, 'w', encoding='utf-8') as f:
-                json.dump(self.webster_dictionary, f, indent=2, ensure_ascii=False)
+            # Concurrent lookups can each trigger a save - serialize them and write a snapshot
+            with self._webster_save_lock:
+                os.makedirs(os.path.dirname(self.webster_file), exist_ok=True)
+                snapshot = dict(self.webster_dictionary)
+                temp_file = f"{self.webster_file}.tmp"
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    json.dump(snapshot, f, indent=2, ensure_ascii=False)
+                os.replace(temp_file, self.webster_file)
         except Exception as e:
             print(f"Error saving Webster's dictionary: {e}")
 
     def set_offline_mode(self, enabled: bool):
         """Set offline mode"""
         self.offline_mode = enabled
+        self.tts_service.set_online(not enabled)
         print(f"Offline mode: {'enabled' if enabled else 'disabled'}")
 
     def set_search_suggestions(self, enabled: bool):
@@ -581,6 +778,16 @@ class DictionaryModel:
         self.search_suggestions = enabled
         print(f"Search suggestions: {'enabled' if enabled else 'disabled'}")
 
+    def set_api_rate_limit(self, requests_per_second: float):
+        """Set the maximum online API request rate (0 disables limiting)"""
+        self.api_limiter.set_rate(requests_per_second)
+        print(f"API rate limit: {requests_per_second or 'unlimited'} requests/s")
+
+    def set_hedged_lookup(self, enabled: bool):
+        """Set hedged lookup (show local entry first, upgrade with online data)"""
+        self.hedged_lookup = enabled
+        print(f"Hedged lookup: {'enabled' if enabled else 'disabled'}")
+
     def _extract_audio_url_free_api(self, data: dict) -> Optional[str]:
         """Extract audio pronunciation URL from free API response"""
         try:
@@ -643,14 +850,79 @@ class DictionaryModel:
             print(f"Error converting free API format: {e}")
             return None
     
-    def check_internet_connection(self) -> bool:
-        """Check if internet connection is available - OPTIMIZED"""
+    def get_pronunciation_audio(self, audio_url: str) -> Optional[bytes]:
+        """Return pronunciation audio bytes for an API audio URL, downloading only when needed"""
+        if not audio_url:
+            return None
+        return self.pronunciation_flight.do(audio_url, lambda: self._fetch_pronunciation_audio(audio_url))
+
+    def _fetch_pronunciation_audio(self, audio_url: str) -> Optional[bytes]:
+        """Return the cached audio for audio_url, revalidating or downloading it if stale or missing"""
+        key = AudioCache.make_key("pronunciation", audio_url)
+        # Bytes are read under the cache lock, so eviction can't remove the file between lookup and read
+        cached = self.pronunciation_cache.get(key)
+        cached_data = cached[1] if cached else None
+        meta = self.pronunciation_cache.get_meta(key) if cached else {}
+        
+        # Fresh enough (or we can't check) - no network at all
+        if cached and (self.offline_mode or time.time() - meta.get('validated_at', 0) < self.pronunciation_max_age):
+            print("💾 Pronunciation cache hit")
+            return cached_data
+        
+        headers = {}
+        if cached and meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if cached and meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        
         try:
-            # Faster check with shorter timeout
-            response = requests.get("https://www.google.com", timeout=2)
-            return True
-        except:
-            return False
+            response = requests.get(audio_url, headers=headers, timeout=10)
+        except requests.exceptions.RequestException as e:
+            print(f"⚠️ Pronunciation download failed: {e}")
+            # A stale copy still beats no audio
+            return cached_data
+        
+        if response.status_code == 304 and cached:
+            print("💾 Pronunciation revalidated (not modified)")
+            self.pronunciation_cache.update_meta(key, validated_at=time.time())
+            return cached_data
+        
+        if response.status_code == 200 and response.content:
+            suffix = os.path.splitext(audio_url.split('?')[0])[1] or '.mp3'
+            meta = {
+                'url': audio_url,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'validated_at': time.time()
+            }
+            print(f"📥 Downloaded pronunciation ({len(response.content) // 1024} KB)")
+            self.pronunciation_cache.put_bytes(key, response.content, suffix, meta)
+            return response.content
+        
+        print(f"⚠️ Pronunciation download returned HTTP {response.status_code}")
+        return cached_data
+
+    def check_internet_connection(self, max_age: Optional[float] = None) -> bool:
+        """Check if internet connection is available, reusing a probe younger than max_age seconds"""
+        if max_age is None:
+            max_age = self.connection_check_ttl
+        # One probe at a time: concurrent lookups wait for it and share its answer
+        with self._connection_lock:
+            if self._connection_state is not None and time.time() - self._connection_checked_at < max_age:
+                return self._connection_state
+            try:
+                # Faster check with shorter timeout
+                requests.get("https://www.google.com", timeout=2)
+                connected = True
+            except:
+                connected = False
+            self._note_connection(connected)
+            return connected
+    
+    def _note_connection(self, connected: bool):
+        """Remember the connectivity state seen by a probe or an API response"""
+        self._connection_state = connected
+        self._connection_checked_at = time.time()
     
     def get_local_word_count(self) -> int:
         """Get number of words in Webster's dictionary"""
@@ -665,8 +937,8 @@ class DictionaryModel:
         suggestions = []
         partial_lower = partial_word.lower()
         
-        # Search through Webster's dictionary for matching words
-        for word in self.webster_dictionary.keys():
+        # Search through Webster's dictionary for matching words (a snapshot, fetch threads may add words)
+        for word in list(self.webster_dictionary):
             if word.startswith(partial_lower) and word != partial_lower:
                 suggestions.append(word)
                 if len(suggestions) >= 10:  # Limit to 10 suggestions
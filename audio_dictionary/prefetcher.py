@@ -0,0 +1,43 @@
+import queue
+import threading
+from typing import Callable, Iterable
+
+from audio_dictionary.audio_engine import CancelToken
+
+# A prefetch task does its work in small steps and checks the token between them
+PrefetchTask = Callable[[CancelToken], None]
+
+
+class AudioPrefetcher:
+    """Warm the audio caches for the word on screen on one low-priority background thread"""
+
+    def __init__(self):
+        self.tasks = queue.Queue()
+        self._lock = threading.Lock()
+        self.token = CancelToken()
+        self.thread = threading.Thread(target=self._run, name="audio-prefetch", daemon=True)
+        self.thread.start()
+
+    def prefetch(self, tasks: Iterable[PrefetchTask]):
+        """Replace any pending prefetch work with tasks, run in order"""
+        with self._lock:
+            self.token.cancel()
+            self.token = CancelToken()
+            token = self.token
+        for task in tasks:
+            self.tasks.put((token, task))
+
+    def cancel(self):
+        """Drop pending work and ask the running task to stop at its next check"""
+        with self._lock:
+            self.token.cancel()
+
+    def _run(self):
+        while True:
+            token, task = self.tasks.get()
+            if token.cancelled:
+                continue
+            try:
+                task(token)
+            except Exception as e:
+                print(f"⚠️ Audio prefetch failed: {e}")
@@ -0,0 +1,146 @@
+import csv
+import os
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+
+class FrameProfiler:
+    """Per-frame timing of the main loop, split into named phases with lap timers"""
+
+    # Frame-time histogram bucket upper bounds in milliseconds (last bucket is open-ended)
+    HISTOGRAM_BOUNDS = (2, 4, 8, 16.7, 33.3, 50, 100)
+
+    def __init__(self, history: int = 600):
+        self.enabled = False
+        self.frames = deque(maxlen=history)
+        self.phases: Dict[str, float] = {}
+        self.frame_number = 0
+        self._frame_start = 0.0
+        self._last_lap = 0.0
+        self._cpu_start = 0.0
+        self._thread_cpu_start = 0.0
+        self._last_frame_start: Optional[float] = None
+        # Overlay numbers are refreshed a few times per second, not every frame
+        self.summary_interval = 0.25
+        self._summary = None
+        self._summary_time = 0.0
+        # Bumped whenever the overlay snapshot changes
+        self.summary_version = 0
+
+    def set_enabled(self, enabled: bool):
+        self.enabled = enabled
+        self._last_frame_start = None
+        if not enabled:
+            self.frames.clear()
+            self._summary = None
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self._frame_start = self._last_lap = now
+        self._cpu_start = time.process_time()
+        self._thread_cpu_start = time.thread_time()
+        self.phases = {}
+
+    def lap(self, phase: str):
+        """Charge the time since the previous lap (or frame start) to `phase`"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + (now - self._last_lap) * 1000
+        self._last_lap = now
+
+    def end_frame(self):
+        if not self.enabled or not self._frame_start:
+            return
+        now = time.perf_counter()
+        # CPU burned by other threads (downloads, TTS, audio engine) while this frame ran
+        process_cpu = time.process_time() - self._cpu_start
+        main_cpu = time.thread_time() - self._thread_cpu_start
+        interval = (self._frame_start - self._last_frame_start) * 1000 if self._last_frame_start else None
+        self.frame_number += 1
+        self.frames.append({
+            'frame': self.frame_number,
+            'time': time.time(),
+            'frame_ms': (now - self._frame_start) * 1000,
+            'interval_ms': interval,
+            'background_cpu_ms': max(0.0, process_cpu - main_cpu) * 1000,
+            'threads': threading.active_count(),
+            'phases': self.phases,
+        })
+        self._last_frame_start = self._frame_start
+        self._frame_start = 0.0
+
+    def fps(self) -> float:
+        """Frames per second over the recorded intervals"""
+        intervals = [f['interval_ms'] for f in self.frames if f['interval_ms']]
+        if not intervals:
+            return 0.0
+        return 1000 * len(intervals) / sum(intervals)
+
+    def histogram(self) -> List[int]:
+        """Frame counts per HISTOGRAM_BOUNDS bucket, plus one for slower frames"""
+        counts = [0] * (len(self.HISTOGRAM_BOUNDS) + 1)
+        for frame in self.frames:
+            for i, bound in enumerate(self.HISTOGRAM_BOUNDS):
+                if frame['frame_ms'] <= bound:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+        return counts
+
+    def phase_averages(self) -> Dict[str, float]:
+        """Mean milliseconds per frame spent in each phase"""
+        if not self.frames:
+            return {}
+        totals: Dict[str, float] = {}
+        for frame in self.frames:
+            for phase, ms in frame['phases'].items():
+                totals[phase] = totals.get(phase, 0.0) + ms
+        return {phase: total / len(self.frames) for phase, total in totals.items()}
+
+    def summary(self) -> Optional[dict]:
+        """Snapshot for the overlay, recomputed at most every summary_interval seconds"""
+        if not self.enabled or not self.frames:
+            return None
+        now = time.time()
+        if self._summary is None or now - self._summary_time >= self.summary_interval:
+            frame_times = [f['frame_ms'] for f in self.frames]
+            self._summary = {
+                'fps': self.fps(),
+                'avg_ms': sum(frame_times) / len(frame_times),
+                'max_ms': max(frame_times),
+                'background_cpu_ms': sum(f['background_cpu_ms'] for f in self.frames) / len(self.frames),
+                'threads': self.frames[-1]['threads'],
+                'histogram': self.histogram(),
+                'phases': self.phase_averages(),
+            }
+            self._summary_time = now
+            self.summary_version += 1
+        return self._summary
+
+    def export(self, directory: str = "data/profiles") -> Optional[str]:
+        """Write the recorded frames as CSV (one row per frame, one column per phase); returns the path"""
+        if not self.frames:
+            print("⚠️ No frame timings recorded yet")
+            return None
+        try:
+            os.makedirs(directory, exist_ok=True)
+            filename = os.path.join(directory, f"frame_profile_{time.strftime('%Y%m%d_%H%M%S')}.csv")
+            phase_names = sorted({phase for frame in self.frames for phase in frame['phases']})
+            columns = ['frame', 'time', 'frame_ms', 'interval_ms', 'background_cpu_ms', 'threads']
+            with open(filename, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(columns + [f"{phase}_ms" for phase in phase_names])
+                for frame in self.frames:
+                    writer.writerow([frame[column] for column in columns] +
+                                    [frame['phases'].get(phase, 0.0) for phase in phase_names])
+            print(f"📊 Frame profile exported to: {filename}")
+            return filename
+        except Exception as e:
+            print(f"❌ Error exporting frame profile: {e}")
+            return None
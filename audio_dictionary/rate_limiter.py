@@ -0,0 +1,96 @@
+import email.utils
+import random
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """Thread-safe token bucket that backs off when the upstream throttles (AIMD)"""
+
+    def __init__(self, rate: float = 5.0, capacity: Optional[float] = None, min_rate: float = 0.2):
+        self._lock = threading.Lock()
+        self.min_rate = min_rate
+        self.max_rate = 0.0
+        self.rate = 0.0
+        self.capacity = 1.0
+        self.tokens = 1.0
+        self.last_refill = time.time()
+        self.paused_until = 0.0
+        self.set_rate(rate, capacity)
+
+    def set_rate(self, rate: float, capacity: Optional[float] = None):
+        """Set the configured maximum requests/second (0 or less disables limiting)"""
+        with self._lock:
+            max_rate = max(0.0, rate or 0.0)
+            # Re-applying the same limit keeps any backoff from recent throttling
+            if max_rate != self.max_rate:
+                self.rate = max_rate
+            self.max_rate = max_rate
+            self.capacity = capacity if capacity else max(1.0, self.max_rate)
+            self.tokens = min(self.tokens, self.capacity)
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Take one token, waiting up to timeout seconds (None waits forever)"""
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            with self._lock:
+                now = time.time()
+                if not self.max_rate and now >= self.paused_until:
+                    return True
+                self._refill(now)
+                if now >= self.paused_until and self.tokens >= 1:
+                    self.tokens -= 1
+                    return True
+                if now < self.paused_until:
+                    wait_time = self.paused_until - now
+                else:
+                    wait_time = (1 - self.tokens) / self.rate
+            if deadline is not None:
+                remaining = deadline - time.time()
+                if remaining <= 0 or wait_time > remaining:
+                    return False
+            time.sleep(min(wait_time, 0.5))
+
+    def on_throttled(self, retry_after: Optional[float] = None):
+        """Upstream said slow down: pause for retry_after and halve the rate"""
+        with self._lock:
+            if retry_after:
+                self.paused_until = max(self.paused_until, time.time() + retry_after)
+            if self.max_rate:
+                self.rate = max(self.min_rate, self.rate / 2)
+                self.tokens = 0.0
+            print(f"🚦 Throttled by upstream - rate now {self.rate:.2f}/s"
+                  + (f", paused {retry_after:.1f}s" if retry_after else ""))
+
+    def on_success(self):
+        """Creep back up towards the configured rate after successful requests"""
+        with self._lock:
+            if self.max_rate and self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.max_rate * 0.05)
+
+    def _refill(self, now: float):
+        """Add tokens for the time elapsed since the last refill (lock must be held)"""
+        elapsed = max(0.0, now - self.last_refill)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.last_refill = now
+
+
+def backoff_delay(attempt: int, base: float = 0.5, cap: float = 8.0) -> float:
+    """Exponential backoff with full jitter for retry number `attempt` (0-based)"""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given as seconds or an HTTP date"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+        return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,64 @@
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+import pygame
+
+
+class SurfaceLRU:
+    """LRU cache of pygame surfaces, bounded by total pixel count"""
+
+    def __init__(self, max_pixels: int):
+        self.max_pixels = max_pixels
+        self.pixels = 0
+        self.surfaces: "OrderedDict[Hashable, pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[pygame.Surface]:
+        """Cached surface for `key` (marked most recently used), or None on a miss"""
+        surface = self.surfaces.get(key)
+        if surface is None:
+            self.misses += 1
+            return None
+        self.surfaces.move_to_end(key)
+        self.hits += 1
+        return surface
+
+    def put(self, key: Hashable, surface: pygame.Surface) -> pygame.Surface:
+        """Cache `surface` under `key`, evicting the least recently used surfaces over the pixel budget"""
+        previous = self.surfaces.pop(key, None)
+        if previous is not None:
+            self.pixels -= previous.get_width() * previous.get_height()
+        self.surfaces[key] = surface
+        self.pixels += surface.get_width() * surface.get_height()
+        # Keep at least the newest surface even if it alone exceeds the budget
+        while self.pixels > self.max_pixels and len(self.surfaces) > 1:
+            _, evicted = self.surfaces.popitem(last=False)
+            self.pixels -= evicted.get_width() * evicted.get_height()
+        return surface
+
+    def clear(self):
+        """Drop every cached surface"""
+        self.surfaces.clear()
+        self.pixels = 0
+
+
+class TextRenderCache(SurfaceLRU):
+    """LRU cache of font.render() surfaces, bounded by total pixel count"""
+
+    def __init__(self, max_pixels: int = 4 * 1024 * 1024):
+        super().__init__(max_pixels)
+
+    def render(self, font: pygame.font.Font, text: str, antialias: bool, color,
+               background: Optional[Tuple] = None) -> pygame.Surface:
+        """Cached font.render(); the returned surface is shared and must not be modified"""
+        key = (text, font, antialias, tuple(color), tuple(background) if background is not None else None)
+        surface = self.get(key)
+        if surface is not None:
+            return surface
+
+        if background is None:
+            surface = font.render(text, antialias, color)
+        else:
+            surface = font.render(text, antialias, color, background)
+        return self.put(key, surface)
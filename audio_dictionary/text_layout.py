@@ -0,0 +1,79 @@
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+
+import pygame
+
+
+class TextLayout:
+    """Word wrapping measured with font.size(), with memoized word widths and wrapped lines"""
+
+    # Lines whose summed width lands this close to the limit are measured as a whole
+    EXACT_MARGIN = 8
+
+    def __init__(self, max_layouts: int = 2048):
+        self.max_layouts = max_layouts
+        self.word_widths: Dict[Tuple[pygame.font.Font, str], int] = {}
+        self.layouts: "OrderedDict[Tuple[str, pygame.font.Font, int], List[str]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def measure(self, font: pygame.font.Font, word: str) -> int:
+        """Width of a single word (or space) in pixels"""
+        key = (font, word)
+        width = self.word_widths.get(key)
+        if width is None:
+            if len(self.word_widths) > 50000:
+                self.word_widths.clear()
+            width = font.size(word)[0]
+            self.word_widths[key] = width
+        return width
+
+    def wrap(self, text: str, font: pygame.font.Font, max_width: int) -> List[str]:
+        """Wrap text into lines no wider than max_width (a single long word keeps its own line)"""
+        if not text:
+            return []
+        key = (text, font, max_width)
+        lines = self.layouts.get(key)
+        if lines is not None:
+            self.layouts.move_to_end(key)
+            self.hits += 1
+            return lines
+
+        self.misses += 1
+        lines = self._wrap(text, font, max_width)
+        self.layouts[key] = lines
+        if len(self.layouts) > self.max_layouts:
+            self.layouts.popitem(last=False)
+        return lines
+
+    def clear(self):
+        """Forget all measurements (fonts changed)"""
+        self.word_widths.clear()
+        self.layouts.clear()
+
+    def _wrap(self, text: str, font: pygame.font.Font, max_width: int) -> List[str]:
+        space_width = self.measure(font, ' ')
+        lines = []
+        current_line = []
+        current_width = 0
+
+        for word in text.split(' '):
+            word_width = self.measure(font, word)
+            # Width of the line with this word appended, joined by a single space
+            test_width = current_width + (space_width if current_line else 0) + word_width
+            if current_line and abs(test_width - max_width) <= self.EXACT_MARGIN:
+                # Summed widths ignore kerning across words - measure the real line near the limit
+                test_width = font.size(' '.join(current_line + [word]))[0]
+            if test_width <= max_width:
+                current_line.append(word)
+                current_width = test_width
+            else:
+                if current_line:
+                    lines.append(' '.join(current_line))
+                current_line = [word]
+                current_width = word_width
+
+        if current_line:
+            lines.append(' '.join(current_line))
+
+        return lines if lines else [text]
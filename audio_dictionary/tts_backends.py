@@ -0,0 +1,152 @@
+import io
+import math
+import os
+import random
+import shutil
+import subprocess
+import time
+import wave
+from array import array
+from typing import Dict, Optional
+
+try:
+    from gtts import gTTS
+except ImportError:  # gTTS is only needed for the online backend
+    gTTS = None
+
+
+class TTSBackend:
+    """Base class for speech synthesis engines used by TextToSpeechService"""
+
+    name = "base"
+    file_suffix = ".mp3"
+    requires_network = False
+    # Whether "auto" selection (and fallback) may pick this backend
+    auto_select = True
+    # Whether output may be stored in (and served from) the TTS caches
+    cacheable = True
+
+    def is_available(self) -> bool:
+        """Check whether this engine can be used on this machine"""
+        return False
+
+    def synthesize(self, text: str, language: str = 'en', slow: bool = False) -> bytes:
+        """Synthesize text and return the encoded audio bytes"""
+        raise NotImplementedError
+
+
+class GTTSBackend(TTSBackend):
+    """Google Translate TTS (online, MP3)"""
+
+    name = "gtts"
+    file_suffix = ".mp3"
+    requires_network = True
+
+    def is_available(self) -> bool:
+        return gTTS is not None
+
+    def synthesize(self, text: str, language: str = 'en', slow: bool = False) -> bytes:
+        buffer = io.BytesIO()
+        gTTS(text=text, lang=language, slow=slow).write_to_fp(buffer)
+        return buffer.getvalue()
+
+
+class EspeakBackend(TTSBackend):
+    """Local espeak-ng / espeak engine run as a subprocess (offline, WAV)"""
+
+    name = "espeak"
+    file_suffix = ".wav"
+    requires_network = False
+
+    def __init__(self, words_per_minute: int = 160, timeout: float = 15.0):
+        self.words_per_minute = words_per_minute
+        self.timeout = timeout
+        self.executable = shutil.which("espeak-ng") or shutil.which("espeak")
+
+    def is_available(self) -> bool:
+        return self.executable is not None
+
+    def synthesize(self, text: str, language: str = 'en', slow: bool = False) -> bytes:
+        speed = int(self.words_per_minute * (0.7 if slow else 1.0))
+        # Text goes in on stdin so a leading "-" can't be parsed as an option
+        result = subprocess.run(
+            [self.executable, "-v", language, "-s", str(speed), "--stdout", "--stdin"],
+            input=text.encode('utf-8'), capture_output=True, timeout=self.timeout, check=True
+        )
+        return result.stdout
+
+
+class SyntheticBackend(TTSBackend):
+    """Deterministic fake engine for tests and benchmarks: a tone as long as the text (offline, WAV)"""
+
+    name = "synthetic"
+    file_suffix = ".wav"
+    requires_network = False
+    auto_select = False
+    # Cached clips would skip the injected latency and failures on every later run
+    cacheable = False
+
+    def __init__(self, latency: float = 0.0, failure_rate: float = 0.0, seed: int = 0,
+                 seconds_per_char: float = 0.06, sample_rate: int = 16000):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.seconds_per_char = seconds_per_char
+        self.sample_rate = sample_rate
+        self.seed = seed
+
+    def is_available(self) -> bool:
+        return True
+
+    def synthesize(self, text: str, language: str = 'en', slow: bool = False) -> bytes:
+        # Seeded per request, so the same text fails the same way whatever order requests run in
+        fail = random.Random(f"{self.seed}:{language}:{slow}:{text}").random() < self.failure_rate
+        if self.latency:
+            time.sleep(self.latency)
+        if fail:
+            raise RuntimeError("synthetic TTS failure")
+
+        duration = max(0.25, len(text) * self.seconds_per_char * (1.5 if slow else 1.0))
+        frame_count = int(duration * self.sample_rate)
+        # One period of a quiet 400 Hz tone, repeated for the whole clip
+        period = self.sample_rate // 400
+        cycle = array('h', (int(8000 * math.sin(2 * math.pi * i / period)) for i in range(period)))
+        samples = (cycle * (frame_count // period + 1))[:frame_count]
+
+        buffer = io.BytesIO()
+        with wave.open(buffer, 'wb') as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(self.sample_rate)
+            wav.writeframes(samples.tobytes())
+        return buffer.getvalue()
+
+
+BACKENDS = {
+    GTTSBackend.name: GTTSBackend,
+    EspeakBackend.name: EspeakBackend,
+    SyntheticBackend.name: SyntheticBackend,
+}
+
+
+def create_backends() -> Dict[str, TTSBackend]:
+    """Instantiate every known backend, keyed by name"""
+    backends = {name: backend_class() for name, backend_class in BACKENDS.items()
+                if backend_class is not SyntheticBackend}
+    # The synthetic engine is tuned from the environment so benchmarks can run it unattended
+    try:
+        backends[SyntheticBackend.name] = SyntheticBackend(
+            latency=float(os.environ.get("AUDIO_DICTIONARY_TTS_LATENCY", 0)),
+            failure_rate=float(os.environ.get("AUDIO_DICTIONARY_TTS_FAILURE_RATE", 0)),
+            seed=int(os.environ.get("AUDIO_DICTIONARY_TTS_SEED", 0))
+        )
+    except ValueError as e:
+        print(f"⚠️ Invalid synthetic TTS settings in environment: {e}")
+        backends[SyntheticBackend.name] = SyntheticBackend()
+    return backends
+
+
+def describe_backend(backend: Optional[TTSBackend]) -> str:
+    """Short human-readable backend description for logging"""
+    if backend is None:
+        return "none"
+    return f"{backend.name} ({'online' if backend.requires_network else 'offline'})"
@@ -1,54 +1,227 @@
-from gtts import gTTS
+import hashlib
 import os
+import re
+import threading
 import time
-import tempfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from audio_dictionary.audio_cache import AudioCache
+from audio_dictionary.single_flight import SingleFlight
+from audio_dictionary.tts_backends import create_backends, describe_backend
+
+# Paths of synthesized audio that exists only in the in-memory cache (never written to disk)
+MEMORY_AUDIO_PREFIX = "memory:"
+
+
+class SpeechPlaylist:
+    """Ordered list of segments being synthesized in parallel, consumable as a stream"""
+    
+    def __init__(self, segments, futures):
+        self.segments = segments
+        self.futures = futures
+    
+    def __len__(self):
+        return len(self.segments)
+    
+    def __iter__(self):
+        """Yield (segment_text, audio_path) in order, waiting only for the next segment"""
+        for segment, future in zip(self.segments, self.futures):
+            if future.cancelled():
+                return
+            try:
+                audio_path = future.result()
+            except Exception as e:
+                print(f"⚠️ Segment synthesis failed: {e}")
+                audio_path = None
+            yield segment, audio_path
+    
+    def cancel(self):
+        """Cancel segments that have not started synthesizing yet"""
+        for future in self.futures:
+            future.cancel()
+
 
 class TextToSpeechService:
-    def __init__(self):
-        # No cache directory - we'll use temporary files
-        pass
+    def __init__(self, cache_dir="data/audio_cache/tts", cache_max_mb=100, max_workers=3, backend="auto"):
+        # Synthesis engines (gTTS online, espeak offline); "auto" picks by connectivity
+        self.backends = create_backends()
+        self.backend_name = "auto"
+        self.online = True
+        self.set_backend(backend)
+        # Synthesized speech is cached on disk by content, so repeats are a local file open
+        self.audio_cache = AudioCache(cache_dir, max_bytes=cache_max_mb * 1024 * 1024, name="TTS")
+        # Concurrent requests for the same speech share one synthesis
+        self.synthesis_flight = SingleFlight("speech synthesis")
+        # Recently synthesized audio kept as bytes so playback never has to touch the disk
+        self.memory_cache = OrderedDict()
+        self.memory_cache_bytes = 0
+        self.memory_cache_max_bytes = 16 * 1024 * 1024
+        self._memory_lock = threading.Lock()
+        # Bounded pool for synthesizing long speech in parallel segments
+        self.synthesis_pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tts")
         
     def generate_audio(self, word, definition_data=None, language='en'):
-        """Generate TTS audio for ANY word - NO STORAGE"""
+        """Generate TTS audio for ANY word - CACHED BY CONTENT"""
         try:
             # Create speech text that ALWAYS works
             speech_text = self.create_guaranteed_speech_text(word, definition_data)
+        except Exception as e:
+            print(f"💥 CRITICAL TTS failure for '{word}': {e}")
+            return None
+        # Keyed on what is actually spoken, so different definitions of one word never share audio
+        key = ("word_audio", speech_text, language)
+        return self.synthesis_flight.do(key, lambda: self._generate_audio(word, speech_text, language))
+    
+    def _generate_audio(self, word, speech_text, language='en'):
+        """Synthesize word audio for generate_audio"""
+        try:
+            audio_path = self._synthesize(speech_text, language, label=f"'{word}'")
+            if audio_path:
+                print(f"✅ SUCCESS: Audio ready for '{word}'")
+            return audio_path
             
-            # Multiple attempts to generate audio
-            for attempt in range(3):
+        except Exception as e:
+            print(f"💥 CRITICAL TTS failure for '{word}': {e}")
+            return None
+
+    def shutdown(self):
+        """Stop the synthesis pool and save the cache index (call once, on exit)"""
+        self.synthesis_pool.shutdown(wait=False, cancel_futures=True)
+        self.audio_cache.flush()
+
+    def is_cached_file(self, path):
+        """Check whether an audio path belongs to the TTS cache (callers must not delete it)"""
+        return bool(path) and (path.startswith(MEMORY_AUDIO_PREFIX) or self.audio_cache.owns(path))
+
+    def has_audio(self, path):
+        """Check whether read_audio can still return audio for a path"""
+        if not path:
+            return False
+        if path.startswith(MEMORY_AUDIO_PREFIX):
+            with self._memory_lock:
+                return path in self.memory_cache
+        return os.path.exists(path)
+
+    def read_audio(self, path):
+        """Return the encoded bytes of a synthesized audio file, from memory when possible"""
+        if not path:
+            return None
+        with self._memory_lock:
+            data = self.memory_cache.get(path)
+            if data is not None:
+                self.memory_cache.move_to_end(path)
+                return data
+        if path.startswith(MEMORY_AUDIO_PREFIX):
+            # Uncached audio only ever lived in memory and has been evicted since
+            print(f"⚠️ Audio {path} is no longer in memory")
+            return None
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError as e:
+            print(f"⚠️ Could not read audio {path}: {e}")
+            return None
+        self._remember_audio(path, data)
+        return data
+
+    def _remember_audio(self, path, data):
+        """Keep audio bytes in the in-memory LRU, evicting the oldest entries beyond the cap"""
+        with self._memory_lock:
+            previous = self.memory_cache.pop(path, None)
+            if previous is not None:
+                self.memory_cache_bytes -= len(previous)
+            self.memory_cache[path] = data
+            self.memory_cache_bytes += len(data)
+            while self.memory_cache_bytes > self.memory_cache_max_bytes and len(self.memory_cache) > 1:
+                _, evicted = self.memory_cache.popitem(last=False)
+                self.memory_cache_bytes -= len(evicted)
+
+    def set_backend(self, name):
+        """Select the TTS backend by name ('auto' chooses by connectivity)"""
+        # The environment wins over settings so tests and benchmarks can force e.g. the synthetic engine
+        name = os.environ.get("AUDIO_DICTIONARY_TTS_BACKEND") or name
+        if name != "auto" and name not in self.backends:
+            print(f"⚠️ Unknown TTS backend '{name}', using auto")
+            name = "auto"
+        self.backend_name = name
+        print(f"TTS backend: {name}")
+
+    def set_online(self, online):
+        """Tell the service whether network backends can be used"""
+        self.online = online
+
+    def get_backend_chain(self):
+        """Backends to try, in order, for the current setting and connectivity"""
+        available = [backend for backend in self.backends.values() if backend.is_available()]
+        usable = [backend for backend in available if self.online or not backend.requires_network]
+        fallbacks = [backend for backend in usable if backend.auto_select]
+        if self.backend_name == "auto":
+            # Prefer the higher quality online voice when we can reach it, local engines otherwise
+            return sorted(fallbacks, key=lambda backend: not backend.requires_network)
+        preferred = self.backends[self.backend_name]
+        chain = [preferred] if preferred in usable else []
+        # An offline engine is still better than silence if the chosen backend can't be used
+        return chain + [backend for backend in fallbacks if backend not in chain and not backend.requires_network]
+
+    def _synthesize(self, text, language='en', slow=False, label="speech"):
+        """Return a cached audio file for text, synthesizing it with the active backend on a cache miss"""
+        chain = self.get_backend_chain()
+        
+        # In auto mode audio cached earlier by any backend (e.g. gTTS while online) is still good
+        lookup_order = list(chain)
+        if self.backend_name == "auto":
+            lookup_order += [backend for backend in self.backends.values()
+                             if backend not in chain and backend.auto_select]
+        for backend in lookup_order:
+            if not backend.cacheable:
+                continue
+            cached = self.audio_cache.get(AudioCache.make_key(backend.name, text, language, slow))
+            if cached:
+                print(f"💾 TTS cache hit for {label} ({backend.name})")
+                # Keep the bytes in memory so playback doesn't depend on the file surviving eviction
+                cached_path, data = cached
+                self._remember_audio(cached_path, data)
+                return cached_path
+        
+        if not chain:
+            print(f"⚠️ No TTS backend available for {label}")
+            return None
+        
+        for backend in chain:
+            cache_key = AudioCache.make_key(backend.name, text, language, slow)
+            # Network engines get a few attempts; local engines either work or don't
+            attempts = 3 if backend.requires_network else 1
+            for attempt in range(attempts):
                 try:
                     if attempt > 0:
-                        print(f"   Attempt {attempt + 1} for '{word}'")
+                        print(f"   Attempt {attempt + 1} for {label}")
                         time.sleep(0.5)
                     
-                    # Create temporary file
-                    with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as temp_file:
-                        temp_path = temp_file.name
+                    data = backend.synthesize(text, language, slow)
                     
-                    tts = gTTS(text=speech_text, lang=language, slow=False)
-                    tts.save(temp_path)
+                    # Verify the audio has content
+                    if data and len(data) > 1000:
+                        if not backend.cacheable:
+                            return self._keep_uncached_audio(data, backend.file_suffix)
+                        path = self.audio_cache.put_bytes(cache_key, data, backend.file_suffix)
+                        if not path:
+                            # Not cacheable after all (e.g. larger than the cache) - still play it
+                            return self._keep_uncached_audio(data, backend.file_suffix)
+                        self._remember_audio(path, data)
+                        return path
                     
-                    # Verify the file was created and has content
-                    if os.path.exists(temp_path) and os.path.getsize(temp_path) > 1000:
-                        print(f"✅ SUCCESS: Audio generated for '{word}'")
-                        return temp_path
-                    else:
-                        print(f"⚠️  File too small, retrying...")
-                        if os.path.exists(temp_path):
-                            os.unlink(temp_path)
-                        continue
+                    print(f"⚠️  Audio from {backend.name} too small")
                         
                 except Exception as e:
-                    print(f"⚠️  Attempt {attempt + 1} failed: {e}")
-                    if 'temp_path' in locals() and os.path.exists(temp_path):
-                        os.unlink(temp_path)
-                    continue
-            
-            return None
-            
-        except Exception as e:
-            print(f"💥 CRITICAL TTS failure for '{word}': {e}")
-            return None
+                    print(f"⚠️  Attempt {attempt + 1} with {describe_backend(backend)} failed: {e}")
+        
+        return None
+
+    def _keep_uncached_audio(self, data, suffix):
+        """Hold audio that isn't cached on disk in memory only, under a 'memory:' path read_audio understands"""
+        path = f"{MEMORY_AUDIO_PREFIX}{hashlib.sha256(data).hexdigest()[:32]}{suffix}"
+        self._remember_audio(path, data)
+        return path
 
     def create_guaranteed_speech_text(self, word, definition_data):
         """Create speech text that ALWAYS works"""
@@ -158,37 +331,46 @@ class TextToSpeechService:
                     
         return None
 
+    def split_into_chunks(self, text, max_chars=180, first_chunk_chars=80):
+        """Split speech text into sentence chunks; the first one is kept short for a fast start"""
+        sentences = [part.strip() for part in re.split(r'(?<=[.!?])\s+', text or "") if part.strip()]
+        chunks = []
+        current = ""
+        for sentence in sentences:
+            limit = first_chunk_chars if not chunks else max_chars
+            if current and len(current) + len(sentence) + 1 > limit:
+                chunks.append(current)
+                current = sentence
+            else:
+                current = f"{current} {sentence}".strip()
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def generate_chunk_audio(self, chunk_text, language='en'):
+        """Generate (or load from cache) audio for one chunk of speech"""
+        key = ("chunk_audio", chunk_text, language)
+        return self.synthesis_flight.do(key, lambda: self._synthesize(chunk_text, language, label=f"chunk '{chunk_text[:30]}'"))
+
+    def synthesize_segments(self, segments, language='en'):
+        """Synthesize segments concurrently and return them as an ordered SpeechPlaylist"""
+        futures = [self.synthesis_pool.submit(self.generate_chunk_audio, segment, language) for segment in segments]
+        return SpeechPlaylist(list(segments), futures)
+
     def generate_definition_audio(self, word, definition_text):
-        """Generate audio specifically for definition text - NO STORAGE"""
+        """Generate audio specifically for definition text - CACHED BY CONTENT"""
+        key = ("definition_audio", definition_text)
+        return self.synthesis_flight.do(key, lambda: self._generate_definition_audio(word, definition_text))
+    
+    def _generate_definition_audio(self, word, definition_text):
+        """Synthesize definition audio for generate_definition_audio"""
         try:
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as temp_file:
-                temp_path = temp_file.name
-            
             print(f"🎵 Generating definition audio for: '{word}'")
-            
-            # Multiple attempts to generate audio
-            for attempt in range(3):
-                try:
-                    if attempt > 0:
-                        print(f"   Definition attempt {attempt + 1} for '{word}'")
-                        time.sleep(0.5)
-                    
-                    tts = gTTS(text=definition_text, lang='en', slow=False)
-                    tts.save(temp_path)
-                    
-                    if os.path.exists(temp_path) and os.path.getsize(temp_path) > 1000:
-                        print(f"✅ SUCCESS: Definition audio generated for '{word}'")
-                        return temp_path
-                        
-                except Exception as e:
-                    print(f"⚠️  Definition attempt {attempt + 1} failed: {e}")
-                    if os.path.exists(temp_path):
-                        os.unlink(temp_path)
-                    continue
-            
-            return None
+            audio_path = self._synthesize(definition_text, 'en', label=f"definition '{word}'")
+            if audio_path:
+                print(f"✅ SUCCESS: Definition audio ready for '{word}'")
+            return audio_path
             
         except Exception as e:
             print(f"💥 CRITICAL TTS failure for definition '{word}': {e}")
-            return None
\ No newline at end of file
+            return None
@@ -0,0 +1,28 @@
+from typing import Tuple
+
+import pygame
+
+from audio_dictionary.render_cache import SurfaceLRU
+
+
+class WidgetSurfaceCache(SurfaceLRU):
+    """LRU cache of pre-drawn translucent widget surfaces (shadows, rounded panels), bounded by total pixel count"""
+
+    def __init__(self, max_pixels: int = 2 * 1024 * 1024):
+        super().__init__(max_pixels)
+
+    def rounded_rect(self, size: Tuple[int, int], color, radius: int = 0, width: int = 0) -> pygame.Surface:
+        """SRCALPHA surface of `size` holding a (possibly translucent) rounded rectangle; shared, do not modify"""
+        size = (max(1, int(size[0])), max(1, int(size[1])))
+        key = (size, tuple(color), radius, width)
+        surface = self.get(key)
+        if surface is not None:
+            return surface
+
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.rect(surface, color, surface.get_rect(), width, border_radius=radius)
+        return self.put(key, surface)
+
+    def shadow(self, size: Tuple[int, int], alpha: int, radius: int) -> pygame.Surface:
+        """Black drop shadow of `size` with the given opacity and corner radius"""
+        return self.rounded_rect(size, (0, 0, 0, alpha), radius)
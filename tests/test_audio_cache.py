@@ -0,0 +1,58 @@
+import contextlib
+import io
+import os
+import tempfile
+import time
+import unittest
+
+from audio_dictionary.audio_cache import AudioCache
+
+
+class AudioCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.cache_dir = os.path.join(self.temp_dir.name, "cache")
+
+    def test_put_and_get_round_trip(self):
+        cache = AudioCache(self.cache_dir)
+        key = AudioCache.make_key("gtts", "hello", "en", False)
+        path = cache.put_bytes(key, b"audio", ".mp3", {"etag": "x"})
+        self.assertTrue(cache.owns(path))
+        self.assertEqual(cache.get(key), (path, b"audio"))
+        self.assertEqual(cache.get_meta(key), {"etag": "x"})
+        self.assertIsNone(cache.get(AudioCache.make_key("gtts", "other", "en", False)))
+
+    def test_evicts_least_recently_used_entries_by_bytes(self):
+        cache = AudioCache(self.cache_dir, max_bytes=250)
+        with contextlib.redirect_stdout(io.StringIO()):
+            cache.put_bytes("a", b"a" * 100)
+            time.sleep(0.01)
+            cache.put_bytes("b", b"b" * 100)
+            time.sleep(0.01)
+            cache.get("a")
+            time.sleep(0.01)
+            cache.put_bytes("c", b"c" * 100)
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+        self.assertFalse(os.path.exists(os.path.join(self.cache_dir, "b.mp3")))
+
+    def test_entry_larger_than_the_cache_is_not_kept(self):
+        cache = AudioCache(self.cache_dir, max_bytes=50)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertIsNone(cache.put_bytes("big", b"x" * 100))
+        self.assertIsNone(cache.get("big"))
+
+    def test_flush_persists_access_times(self):
+        cache = AudioCache(self.cache_dir)
+        cache.put_bytes("a", b"audio")
+        cache.get("a")
+        accessed = cache.index["a"]["last_access"]
+        cache.flush()
+        reloaded = AudioCache(self.cache_dir)
+        self.assertEqual(reloaded.index["a"]["last_access"], accessed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import contextlib
+import io
+import threading
+import time
+import unittest
+
+from audio_dictionary.circuit_breaker import CircuitBreaker
+
+
+def quiet():
+    return contextlib.redirect_stdout(io.StringIO())
+
+
+class CircuitBreakerTest(unittest.TestCase):
+    def make_breaker(self, probe_result=True):
+        self.probed = threading.Event()
+
+        def probe(timeout):
+            self.probed.set()
+            return probe_result
+
+        return CircuitBreaker("test", failure_threshold=2, recovery_timeout=0.05, probe=probe)
+
+    def wait_for_state(self, breaker, state):
+        deadline = time.time() + 5
+        while breaker.get_state() != state and time.time() < deadline:
+            time.sleep(0.01)
+        return breaker.get_state()
+
+    def test_opens_after_consecutive_failures(self):
+        breaker = self.make_breaker()
+        with quiet():
+            breaker.record_failure()
+            self.assertTrue(breaker.allow_request())
+            breaker.record_failure()
+        self.assertEqual(breaker.get_state(), CircuitBreaker.OPEN)
+        self.assertFalse(breaker.allow_request())
+
+    def test_success_resets_the_failure_count(self):
+        breaker = self.make_breaker()
+        with quiet():
+            breaker.record_failure()
+            breaker.record_success(0.1)
+            breaker.record_failure()
+        self.assertEqual(breaker.get_state(), CircuitBreaker.CLOSED)
+
+    def test_healthy_probe_closes_the_circuit(self):
+        breaker = self.make_breaker(probe_result=True)
+        with quiet():
+            breaker.record_failure()
+            breaker.record_failure()
+            time.sleep(0.06)
+            # Requests still skip the network while the background probe runs
+            self.assertFalse(breaker.allow_request())
+            self.assertTrue(self.probed.wait(5))
+            self.assertEqual(self.wait_for_state(breaker, CircuitBreaker.CLOSED), CircuitBreaker.CLOSED)
+        self.assertTrue(breaker.allow_request())
+
+    def test_failed_probe_reopens_with_a_longer_recovery_timeout(self):
+        breaker = self.make_breaker(probe_result=False)
+        with quiet():
+            breaker.record_failure()
+            breaker.record_failure()
+            time.sleep(0.06)
+            breaker.allow_request()
+            self.assertTrue(self.probed.wait(5))
+            self.assertEqual(self.wait_for_state(breaker, CircuitBreaker.OPEN), CircuitBreaker.OPEN)
+        self.assertAlmostEqual(breaker.recovery_timeout, 0.1)
+
+    def test_timeout_follows_latency_including_timeouts(self):
+        breaker = CircuitBreaker("test", failure_threshold=100)
+        with quiet():
+            for _ in range(20):
+                breaker.record_success(0.1)
+            self.assertEqual(breaker.get_timeout(), breaker.min_timeout)
+            # Calls timing out at the adapted timeout must let it grow back
+            for _ in range(20):
+                breaker.record_failure(breaker.get_timeout())
+        self.assertEqual(breaker.get_timeout(), breaker.max_timeout)
+
+
+if __name__ == "__main__":
+    unittest.main()
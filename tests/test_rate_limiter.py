@@ -0,0 +1,90 @@
+import contextlib
+import email.utils
+import io
+import time
+import unittest
+from unittest import mock
+
+from audio_dictionary import rate_limiter
+from audio_dictionary.rate_limiter import TokenBucket, parse_retry_after
+
+
+class FakeTime:
+    """Clock for the rate limiter: sleeping advances it instantly"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class TokenBucketTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeTime()
+        patcher = mock.patch.object(rate_limiter, "time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_tokens_refill_at_the_configured_rate(self):
+        bucket = TokenBucket(rate=2.0)
+        # A new bucket holds a single token, not a full burst
+        self.assertTrue(bucket.acquire(timeout=0))
+        self.assertFalse(bucket.acquire(timeout=0))
+        self.clock.now += 0.5
+        self.assertTrue(bucket.acquire(timeout=0))
+        self.assertFalse(bucket.acquire(timeout=0))
+        # Idle time refills up to the capacity (one second's worth of requests)
+        self.clock.now += 10
+        self.assertTrue(bucket.acquire(timeout=0))
+        self.assertTrue(bucket.acquire(timeout=0))
+        self.assertFalse(bucket.acquire(timeout=0))
+
+    def test_acquire_waits_for_the_next_token(self):
+        bucket = TokenBucket(rate=2.0, capacity=1)
+        self.assertTrue(bucket.acquire(timeout=0))
+        start = self.clock.now
+        self.assertTrue(bucket.acquire(timeout=1))
+        self.assertAlmostEqual(self.clock.now - start, 0.5)
+
+    def test_zero_rate_is_unlimited(self):
+        bucket = TokenBucket(rate=0)
+        for _ in range(100):
+            self.assertTrue(bucket.acquire(timeout=0))
+
+    def test_throttling_pauses_for_retry_after_and_halves_the_rate(self):
+        bucket = TokenBucket(rate=4.0)
+        with contextlib.redirect_stdout(io.StringIO()):
+            bucket.on_throttled(retry_after=2.0)
+        self.assertEqual(bucket.rate, 2.0)
+        self.assertFalse(bucket.acquire(timeout=1))
+        self.assertTrue(bucket.acquire(timeout=3))
+        self.assertGreaterEqual(self.clock.now, 1002.0)
+
+    def test_success_creeps_back_to_the_configured_rate(self):
+        bucket = TokenBucket(rate=4.0)
+        with contextlib.redirect_stdout(io.StringIO()):
+            bucket.on_throttled()
+        for _ in range(100):
+            bucket.on_success()
+        self.assertEqual(bucket.rate, 4.0)
+
+
+class ParseRetryAfterTest(unittest.TestCase):
+    def test_seconds(self):
+        self.assertEqual(parse_retry_after("120"), 120.0)
+
+    def test_http_date(self):
+        value = email.utils.formatdate(time.time() + 60, usegmt=True)
+        self.assertAlmostEqual(parse_retry_after(value), 60, delta=2)
+
+    def test_missing_or_invalid(self):
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after("soon"))
+
+
+if __name__ == "__main__":
+    unittest.main()
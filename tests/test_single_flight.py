@@ -0,0 +1,70 @@
+import contextlib
+import io
+import threading
+import time
+import unittest
+
+from audio_dictionary.single_flight import SingleFlight
+
+
+class SingleFlightTest(unittest.TestCase):
+    def run_with_follower(self, leader_fn):
+        """Start a leader call for key 'k', join it with a follower and return (leader, follower) outcomes"""
+        flight = SingleFlight("test")
+        release = threading.Event()
+        outcomes = {}
+        follower_calls = []
+
+        def call(name, fn):
+            try:
+                outcomes[name] = ("result", flight.do("k", fn))
+            except Exception as e:
+                outcomes[name] = ("error", e)
+
+        def leader():
+            release.wait(5)
+            return leader_fn()
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            leader_thread = threading.Thread(target=call, args=("leader", leader))
+            leader_thread.start()
+            while not flight.in_flight("k"):
+                time.sleep(0.001)
+            follower_thread = threading.Thread(target=call, args=("follower", lambda: follower_calls.append(1)))
+            follower_thread.start()
+            # Give the follower time to join before the leader finishes
+            time.sleep(0.05)
+            release.set()
+            leader_thread.join(5)
+            follower_thread.join(5)
+
+        self.assertEqual(follower_calls, [])
+        self.assertFalse(flight.in_flight("k"))
+        return outcomes["leader"], outcomes["follower"]
+
+    def test_follower_shares_the_leader_result(self):
+        result = object()
+        leader, follower = self.run_with_follower(lambda: result)
+        self.assertEqual(leader, ("result", result))
+        self.assertEqual(follower, ("result", result))
+
+    def test_follower_sees_the_leader_exception(self):
+        error = RuntimeError("boom")
+
+        def fail():
+            raise error
+
+        leader, follower = self.run_with_follower(fail)
+        self.assertEqual(leader, ("error", error))
+        self.assertEqual(follower, ("error", error))
+
+    def test_later_calls_run_again(self):
+        flight = SingleFlight("test")
+        calls = []
+        flight.do("k", lambda: calls.append(1))
+        flight.do("k", lambda: calls.append(2))
+        self.assertEqual(calls, [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
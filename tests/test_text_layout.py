@@ -0,0 +1,46 @@
+import os
+import unittest
+import warnings
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import pygame
+
+from audio_dictionary.text_layout import TextLayout
+
+TEXT = ("The occurrence and development of events by chance in a happy or beneficial way, "
+        "often while looking for something else entirely.")
+
+
+class TextLayoutTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.font.init()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            cls.font = pygame.font.SysFont("arial", 16)
+
+    def test_memoized_wrap_matches_an_uncached_wrap(self):
+        layout = TextLayout()
+        for width in (80, 150, 300, 1000):
+            first = layout.wrap(TEXT, self.font, width)
+            self.assertEqual(layout.wrap(TEXT, self.font, width), first)
+            self.assertEqual(TextLayout().wrap(TEXT, self.font, width), first)
+        self.assertEqual(layout.hits, 4)
+
+    def test_lines_fit_the_width(self):
+        lines = TextLayout().wrap(TEXT, self.font, 150)
+        self.assertEqual(" ".join(lines), TEXT)
+        for line in lines:
+            if " " in line:
+                self.assertLessEqual(self.font.size(line)[0], 150)
+
+    def test_long_word_keeps_its_own_line(self):
+        self.assertEqual(TextLayout().wrap("a supercalifragilistic b", self.font, 30),
+                         ["a", "supercalifragilistic", "b"])
+
+    def test_empty_text(self):
+        self.assertEqual(TextLayout().wrap("", self.font, 100), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import contextlib
+import io
+import os
+import tempfile
+import threading
+import unittest
+
+from audio_dictionary.tts_backends import SyntheticBackend
+from audio_dictionary.tts_service import MEMORY_AUDIO_PREFIX, TextToSpeechService
+
+
+class BlockingBackend(SyntheticBackend):
+    """Synthetic backend that holds every request until released, to test cancellation"""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+        self.running = threading.Event()
+        self.started = []
+
+    def synthesize(self, text, language='en', slow=False):
+        self.started.append(text)
+        self.running.set()
+        self.release.wait(5)
+        return super().synthesize(text, language, slow)
+
+
+class SyntheticTTSTest(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.service = TextToSpeechService(cache_dir=self.cache_dir.name, max_workers=1, backend="synthetic")
+
+    def tearDown(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.service.shutdown()
+        self.cache_dir.cleanup()
+
+    def test_audio_is_deterministic_and_never_written_to_disk(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            path = self.service.generate_chunk_audio("A fortunate discovery.")
+            data = self.service.read_audio(path)
+            again = SyntheticBackend().synthesize("A fortunate discovery.")
+        self.assertTrue(path.startswith(MEMORY_AUDIO_PREFIX))
+        self.assertTrue(self.service.has_audio(path))
+        self.assertEqual(data[:4], b"RIFF")
+        self.assertEqual(data, again)
+        self.assertEqual([name for name in os.listdir(self.cache_dir.name) if name != "index.json"], [])
+
+    def test_failing_backend_yields_no_audio(self):
+        self.service.backends["synthetic"] = SyntheticBackend(failure_rate=1.0)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertIsNone(self.service.generate_chunk_audio("Never spoken."))
+
+    def test_cancelled_playlist_skips_pending_segments(self):
+        backend = BlockingBackend()
+        self.service.backends["synthetic"] = backend
+        segments = ["First sentence.", "Second sentence.", "Third sentence."]
+        with contextlib.redirect_stdout(io.StringIO()):
+            playlist = self.service.synthesize_segments(segments)
+            self.assertTrue(backend.running.wait(5))
+            playlist.cancel()
+            backend.release.set()
+            played = [segment for segment, _ in playlist]
+        # Only the segment already running on the single worker gets synthesized
+        self.assertEqual(backend.started, ["First sentence."])
+        self.assertEqual(played, ["First sentence."])
+
+
+if __name__ == "__main__":
+    unittest.main()